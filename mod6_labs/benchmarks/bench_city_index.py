@@ -0,0 +1,70 @@
+"""Load, prefix and fuzzy lookup cost of CityIndex on a large city list.
+
+    python benchmarks/bench_city_index.py --cities 200000
+"""
+import argparse
+import random
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from city_index import CityIndex  # noqa: E402
+
+SYLLABLES = ["ka", "lo", "ma", "ri", "san", "ta", "ne", "bu", "ville", "ton", "ga", "or", "el", "quin"]
+
+
+def make_city_file(path: Path, count: int, seed: int = 7):
+    rng = random.Random(seed)
+    names = []
+    with open(path, "w", encoding="utf-8") as f:
+        for _ in range(count):
+            name = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).title()
+            country = "".join(rng.choice(string.ascii_uppercase) for _ in range(2))
+            names.append(name)
+            f.write(f"{name}|{country}\n")
+    return names
+
+
+def per_call_us(fn, queries):
+    start = time.perf_counter()
+    for q in queries:
+        fn(q)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cities", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "cities.txt"
+        names = make_city_file(path, args.cities)
+        index = CityIndex(path)
+
+        start = time.perf_counter()
+        index.load()
+        print(f"load ({args.cities} cities) : {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+        prefixes = [rng.choice(names)[: rng.randint(2, 6)] for _ in range(args.queries)]
+        exact = [rng.choice(names) for _ in range(args.queries)]
+        typos = []
+        for _ in range(args.queries):
+            name = rng.choice(names)
+            i = rng.randrange(1, len(name))
+            typos.append(name[:i] + rng.choice(string.ascii_lowercase) + name[i + 1:])
+
+        index.closest(typos[0])  # build the fuzzy buckets once
+        print(f"resolve (exact)        : {per_call_us(index.resolve, exact):8.1f} us/query")
+        print(f"suggest (prefix)       : {per_call_us(index.suggest, prefixes):8.1f} us/query")
+        print(f"closest (one typo)     : {per_call_us(index.closest, typos):8.1f} us/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""aggregate_forecast vs the strptime-based _process_forecast_data it replaced.
+
+    python benchmarks/bench_forecast.py
+"""
+import sys
+import timeit
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from forecast import aggregate_forecast  # noqa: E402
+import core_path  # noqa: E402,F401
+from weather_core.models import Forecast  # noqa: E402
+from weather_core.benchmarks.payloads import make_forecast  # noqa: E402
+
+
+def legacy_process_forecast_data(forecast_list):
+    daily_data = {}
+    today = datetime.now().date()
+
+    for item in forecast_list:
+        dt_txt = datetime.strptime(item['dt_txt'], '%Y-%m-%d %H:%M:%S')
+        day = dt_txt.date()
+
+        if day == today:
+            continue
+
+        if day not in daily_data or abs(dt_txt.hour - 12) < abs(daily_data[day]['dt'].hour - 12):
+            daily_data[day] = {
+                'dt': dt_txt,
+                'day': dt_txt.strftime('%A'),
+                'temp': item['main']['temp'],
+                'icon': item['weather'][0]['icon'],
+                'description': item['weather'][0]['description'].title(),
+            }
+
+    return list(daily_data.values())[:5]
+
+
+def main():
+    print(f"{'slots':>8} {'legacy (noon only)':>20} {'parse + aggregate':>18}")
+    for slots in (40, 400, 4000, 40000):
+        data = make_forecast(slots)
+        number = max(1, 40000 // slots)
+        legacy = min(timeit.repeat(lambda: legacy_process_forecast_data(data["list"]), number=number, repeat=5))
+        new = min(timeit.repeat(lambda: aggregate_forecast(Forecast.from_json(data), days=slots), number=number, repeat=5))
+        print(f"{slots:>8} {legacy / number * 1e3:>17.3f} ms {new / number * 1e3:>15.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Per-refresh allocations for the forecast list: rebuilding every row vs
+rebinding a recycled RowPool, for the 5-day view and a 40-slot view.
+
+    python benchmarks/bench_forecast_rows.py --refreshes 30
+"""
+import argparse
+import asyncio
+import statistics
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import flet as ft  # noqa: E402
+from flet.core.control import Control  # noqa: E402
+
+from bench_render import RecordingConnection  # noqa: E402
+from forecast import aggregate_forecast  # noqa: E402
+from forecast_rows import ICON_URL, RowPool  # noqa: E402
+import core_path  # noqa: E402,F401
+from weather_core.models import Forecast  # noqa: E402
+from weather_core.benchmarks.payloads import make_forecast  # noqa: E402
+
+created = 0
+_control_init = Control.__init__
+
+
+def _counting_init(self, *args, **kwargs):
+    global created
+    created += 1
+    _control_init(self, *args, **kwargs)
+
+
+Control.__init__ = _counting_init
+
+
+def daily_rows(forecast):
+    return [(d.day, d.icon, d.description, f"{d.temp:.0f}°C", f"H {d.temp_max:.0f}° L {d.temp_min:.0f}°")
+            for d in aggregate_forecast(forecast)]
+
+
+def slot_rows(forecast):
+    return [(str(s.dt), s.icon, s.description, f"{s.temp:.0f}°C", "") for s in forecast.slots]
+
+
+def rebuild(column, rows):
+    # the pre-pool display_5day_forecast
+    column.controls = [
+        ft.Container(
+            content=ft.Row(
+                [
+                    ft.Text(label, size=16, weight=ft.FontWeight.BOLD, width=80),
+                    ft.Image(src=ICON_URL.format(icon), width=50, height=50),
+                    ft.Text(description, size=14, color=ft.Colors.GREY_700, expand=True),
+                    ft.Column(
+                        [
+                            ft.Text(temp, size=18, weight=ft.FontWeight.BOLD),
+                            ft.Text(range_text, size=12, color=ft.Colors.GREY_700),
+                        ],
+                        spacing=0,
+                        horizontal_alignment=ft.CrossAxisAlignment.END,
+                    ),
+                ],
+                alignment=ft.MainAxisAlignment.SPACE_BETWEEN
+            ),
+            padding=ft.padding.symmetric(vertical=5, horizontal=10),
+            border=ft.border.only(bottom=ft.border.BorderSide(0.5, ft.Colors.BLACK12)),
+        )
+        for label, icon, description, temp, range_text in rows
+    ]
+
+
+def measure(page, render, batches):
+    global created
+    render(batches[0])  # first paint
+    page.update()
+    peaks, counts = [], []
+    tracemalloc.start()
+    for rows in batches[1:]:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        created = 0
+        render(rows)
+        page.update()
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+        counts.append(created)
+    tracemalloc.stop()
+    return peaks, counts
+
+
+async def run(refreshes):
+    loop = asyncio.get_running_loop()
+    forecasts = [Forecast.from_json(make_forecast(seed=i)) for i in range(refreshes + 1)]
+    for view, to_rows in (("5-day", daily_rows), ("40-slot", slot_rows)):
+        batches = [to_rows(f) for f in forecasts]
+        for label in ("rebuild", "pool"):
+            conn = RecordingConnection(loop)
+            page = ft.Page(conn, "bench", loop)
+            conn.sessions["bench"] = page
+            column = ft.Column()
+            page.add(column)
+            if label == "rebuild":
+                render = lambda rows: rebuild(column, rows)  # noqa: E731
+            else:
+                pool = RowPool(column)
+
+                def render(rows, pool=pool):
+                    for row, values in zip(pool.acquire(len(rows)), rows):
+                        row.bind(*values)
+
+            peaks, counts = measure(page, render, batches)
+            print(f"{view:>7} {label:>7}: {statistics.mean(counts):5.0f} controls/refresh  "
+                  f"peak {statistics.mean(peaks) / 1024:7.1f} KiB/refresh  "
+                  f"(min {min(peaks) / 1024:.1f}, max {max(peaks) / 1024:.1f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--refreshes", type=int, default=30)
+    args = parser.parse_args()
+    asyncio.run(run(args.refreshes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Cost of recording a search and reading the dropdown entries as the history
+grows: the old capped MRU list vs the frecency-ranked HistoryStore.
+
+    python benchmarks/bench_history.py --touches 20000
+"""
+import argparse
+import random
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import history  # noqa: E402
+from history import HistoryStore  # noqa: E402
+
+
+class ListHistory:
+    # the pre-change _add_to_history, with the cap raised to `limit`
+    def __init__(self, limit):
+        self.limit = limit
+        self.items = []
+
+    def touch(self, city):
+        if city in self.items:
+            self.items.remove(city)
+        self.items.insert(0, city)
+        self.items = self.items[:self.limit]
+
+    def top(self, n=10):
+        return self.items[:n]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        self.now += 30.0
+        return self.now
+
+
+def workload(size, touches, seed=7):
+    # a few favourites searched constantly, a long tail of one-off cities
+    rng = random.Random(seed)
+    favourites = [f"Fav {i}" for i in range(20)]
+    return [rng.choice(favourites) if rng.random() < 0.6 else f"City {rng.randrange(size * 2)}"
+            for _ in range(touches)]
+
+
+def bench(store, size, cities):
+    for i in range(size):
+        store.touch(f"City {i}")
+    touch = timeit.timeit(lambda: [store.touch(c) for c in cities], number=1) / len(cities)
+    top = timeit.timeit(store.top, number=2000) / 2000
+    return touch, top
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--touches", type=int, default=20000)
+    args = parser.parse_args()
+
+    history.HistoryStore._schedule = lambda self: None  # measure memory only, no writer
+    tmp = Path(tempfile.mkdtemp()) / "history.json"
+
+    print(f"{'entries':>8} {'list touch':>12} {'store touch':>12} {'list top':>10} {'store top':>10}")
+    for size in (100, 1_000, 10_000, 100_000):
+        cities = workload(size, args.touches)
+        list_touch, list_top = bench(ListHistory(size), size, cities)
+        store = HistoryStore(tmp, limit=size, top_k=10, clock=FakeClock())
+        store_touch, store_top = bench(store, size, cities)
+        print(f"{size:>8} {list_touch * 1e6:>10.2f}us {store_touch * 1e6:>10.2f}us "
+              f"{list_top * 1e6:>8.2f}us {store_top * 1e6:>8.2f}us")
+
+
+if __name__ == "__main__":
+    main()
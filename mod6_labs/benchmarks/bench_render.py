@@ -0,0 +1,114 @@
+"""Bytes sent to the Flet client per current-weather refresh: rebuilding the
+card tree on every update vs patching the existing controls in place.
+
+    python benchmarks/bench_render.py --updates 50
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("OPENWEATHER_API_KEY", "bench")
+
+import flet as ft  # noqa: E402
+from flet.core.protocol import CommandEncoder  # noqa: E402
+from flet.flet_socket_server import FletSocketServer  # noqa: E402
+
+from config import Config  # noqa: E402
+import core_path  # noqa: E402,F401
+from weather_core.models import CurrentConditions  # noqa: E402
+from weather_core.benchmarks.payloads import make_current  # noqa: E402
+
+
+class RecordingConnection(FletSocketServer):
+    """Encodes outgoing messages exactly like the socket server, but only counts them."""
+
+    def __init__(self, loop):
+        super().__init__(loop)
+        self.sent = []
+
+    def _FletSocketServer__send(self, message):
+        self.sent.append(len(json.dumps(message, cls=CommandEncoder, separators=(",", ":"))))
+
+
+def legacy_display(app, data):
+    # the pre-change display_current_weather: a fresh subtree every time
+    temp = data.temp
+    app.current_weather_container.content = ft.Column(
+        [
+            ft.Text(f"{data.city}, {data.country}", size=24, weight=ft.FontWeight.BOLD),
+            ft.Row(
+                [
+                    ft.Image(src=f"https://openweathermap.org/img/wn/{data.icon}@2x.png",
+                             width=100, height=100),
+                    ft.Text(data.description, size=20, italic=True),
+                ],
+                alignment=ft.MainAxisAlignment.CENTER,
+            ),
+            ft.Text(f"{temp:.1f}°C", size=48, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_900),
+            ft.Text(f"Feels like {data.feels_like:.1f}°C", size=16, color=ft.Colors.GREY_700),
+            ft.Divider(),
+            ft.Row(
+                [
+                    app.create_info_card(ft.Icons.WATER_DROP, "Humidity", f"{data.humidity}%"),
+                    app.create_info_card(ft.Icons.AIR, "Wind Speed", f"{data.wind_speed:.1f} m/s"),
+                ],
+                alignment=ft.MainAxisAlignment.SPACE_EVENLY,
+            ),
+        ],
+        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+        spacing=10,
+    )
+    app.current_weather_container.visible = True
+    app.page.update()
+
+
+def measure(app, conn, render, samples):
+    render(app, samples[0])  # first paint is the same cost either way
+    app.updates.flush()
+    conn.sent.clear()
+    for data in samples[1:]:
+        render(app, data)
+        app.updates.flush()
+    return sum(conn.sent), len(conn.sent)
+
+
+async def run(updates):
+    from main import WeatherApp
+
+    loop = asyncio.get_running_loop()
+    samples = [CurrentConditions.from_json(make_current("Manila", "PH", seed=i))
+               for i in range(updates + 1)]
+    results = {}
+    for label, render in (("rebuild", legacy_display),
+                          ("in place", WeatherApp.display_current_weather)):
+        conn = RecordingConnection(loop)
+        page = ft.Page(conn, "bench", loop)
+        conn.sessions["bench"] = page
+        app = WeatherApp(page)
+        results[label] = measure(app, conn, render, samples)
+        await app.weather_service.aclose()
+
+    for label, (total, messages) in results.items():
+        print(f"{label:>9}: {total / max(messages, 1):8.0f} bytes/update  "
+              f"({total} bytes over {messages} messages)")
+    print(f"reduction: {results['rebuild'][0] / max(results['in place'][0], 1):.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--updates", type=int, default=50)
+    args = parser.parse_args()
+
+    Config.CACHE_DB = ":memory:"
+    Config.ICON_WARMUP = False
+    os.chdir(tempfile.mkdtemp())  # keep search_history.json out of the repo
+    asyncio.run(run(args.updates))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Websocket messages sent per search: an immediate page.update() at every
+call site vs the frame-coalescing UpdateScheduler.
+
+    python benchmarks/bench_updates.py --searches 20
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("OPENWEATHER_API_KEY", "bench")
+
+import flet as ft  # noqa: E402
+
+from bench_render import RecordingConnection  # noqa: E402
+from config import Config  # noqa: E402
+import core_path  # noqa: E402,F401
+from weather_core.models import CurrentConditions, Forecast  # noqa: E402
+from weather_core.benchmarks.payloads import make_current, make_forecast  # noqa: E402
+
+
+class ImmediateUpdates:
+    # the old behaviour: every call site pushes its own diff
+    def __init__(self, page):
+        self.page = page
+
+    def mark_dirty(self):
+        self.page.update()
+
+
+async def run(searches):
+    from main import WeatherApp
+
+    loop = asyncio.get_running_loop()
+    bundles = [
+        (CurrentConditions.from_json(make_current("Manila", "PH", seed=i)),
+         Forecast.from_json(make_forecast(seed=i)))
+        for i in range(searches)
+    ]
+
+    async def fake_bundle(city):
+        await asyncio.sleep(0.02)  # network
+        return bundles[hash(city) % len(bundles)]
+
+    for label in ("immediate", "coalesced"):
+        conn = RecordingConnection(loop)
+        page = ft.Page(conn, "bench", loop)
+        conn.sessions["bench"] = page
+        app = WeatherApp(page)
+        if label == "immediate":
+            app.updates = ImmediateUpdates(page)
+        app.weather_service.get_weather_bundle = fake_bundle
+        await asyncio.sleep(0.2)
+        conn.sent.clear()
+
+        for i in range(searches):
+            app.current_city = f"City {i}"
+            await app.get_weather()
+            await asyncio.sleep(0.2)  # let the fades and the last flush land
+        total = sum(conn.sent)
+        print(f"{label:>9}: {len(conn.sent) / searches:5.1f} messages/search  "
+              f"{total / searches:8.0f} bytes/search")
+        await app.weather_service.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--searches", type=int, default=20)
+    args = parser.parse_args()
+
+    Config.CACHE_DB = ":memory:"
+    Config.ICON_WARMUP = False
+    os.chdir(tempfile.mkdtemp())  # keep search_history.json out of the repo
+    asyncio.run(run(args.searches))
+
+
+if __name__ == "__main__":
+    main()
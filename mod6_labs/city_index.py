@@ -0,0 +1,180 @@
+import threading
+import unicodedata
+from array import array
+from bisect import bisect_left
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+_PREFIX_SCAN = 200  # prefix hits ranked per query; enough for a dropdown
+_FUZZY_HEAD = 8  # typo index covers single edits in the first 8 characters
+_HASH_BITS = 40
+_ID_BITS = 23
+
+
+def normalize(text: str) -> str:
+    # "  São  Paulo ,BR" -> "sao paulo, br"
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(c for c in text if not unicodedata.combining(c))
+    parts = (" ".join(part.split()) for part in text.casefold().split(","))
+    return ", ".join(part for part in parts if part)
+
+
+def _deletion_variants(key: str) -> Iterator[str]:
+    head = key[:_FUZZY_HEAD]
+    yield head
+    for i in range(len(head)):
+        yield head[:i] + head[i + 1:]
+
+
+def _variant_hash(variant: str) -> int:
+    return hash(variant) & ((1 << _HASH_BITS) - 1)
+
+
+class CityIndex:
+    # Bundled list of "Name|CC" lines (most prominent first), loaded lazily
+    # into a sorted key array: prefix lookups are a bisect plus a short scan.
+    # Typos go through a symmetric-deletion index (every name's single-char
+    # deletions, hashed and packed into one sorted int array), so a fuzzy
+    # lookup is a handful of bisects instead of a scan over ~200k names.
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._labels: List[str] = []
+        self._keys: List[str] = []
+        self._targets: List[int] = []
+        self._exact: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._variants: Optional[array] = None
+
+    def load(self):
+        with self._lock:
+            if self._loaded:
+                return
+            pairs = []
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line or line.startswith("#"):
+                            continue
+                        name, _, country = line.partition("|")
+                        entry = len(self._labels)
+                        key = normalize(name)
+                        if key not in self._exact:
+                            self._exact[key] = entry
+                            self._names.append(key)
+                        pairs.append((key, entry))
+                        if country:
+                            self._labels.append(f"{name}, {country}")
+                            label_key = f"{key}, {country.casefold()}"
+                            self._exact.setdefault(label_key, entry)
+                            pairs.append((label_key, entry))
+                        else:
+                            self._labels.append(name)
+            except FileNotFoundError:
+                pass  # no bundled index: every lookup falls through to the API
+            pairs.sort()
+            self._keys = [key for key, _ in pairs]
+            self._targets = [entry for _, entry in pairs]
+            self._loaded = True
+
+    def prepare(self):
+        # load everything up front (e.g. from a worker thread at startup) so
+        # the first keystroke does not pay for it
+        self.load()
+        self._variant_index()
+
+    def __len__(self) -> int:
+        self.load()
+        return len(self._labels)
+
+    def resolve(self, query: str) -> Optional[str]:
+        # Canonical "Name, CC" for an exact (case/accent-insensitive) match.
+        self.load()
+        entry = self._exact.get(normalize(query))
+        return None if entry is None else self._labels[entry]
+
+    def has_name(self, query: str) -> bool:
+        # Whether the city name, ignoring any country, is in the index.
+        self.load()
+        return normalize(query).partition(", ")[0] in self._exact
+
+    def suggest(self, query: str, limit: int = 5) -> List[str]:
+        key = normalize(query)
+        if not key:
+            return []
+        self.load()
+
+        entries = []
+        seen = set()
+        i = bisect_left(self._keys, key)
+        while (
+            i < len(self._keys)
+            and len(entries) < _PREFIX_SCAN
+            and self._keys[i].startswith(key)
+        ):
+            entry = self._targets[i]
+            if entry not in seen:
+                seen.add(entry)
+                entries.append(entry)
+            i += 1
+        entries.sort()  # entries are numbered by prominence
+
+        results = [self._labels[entry] for entry in entries[:limit]]
+        if not results:
+            guess = self.closest(query)
+            if guess is not None:
+                results.append(guess)
+        return results
+
+    def _variant_index(self) -> array:
+        with self._lock:
+            if self._variants is None:
+                packed = [
+                    _variant_hash(variant) << _ID_BITS | name_id
+                    for name_id, name in enumerate(self._names)
+                    for variant in set(_deletion_variants(name))
+                ]
+                packed.sort()
+                self._variants = array("q", packed)
+            return self._variants
+
+    def _candidates(self, name: str) -> Iterator[int]:
+        variants = self._variant_index()
+        for variant in set(_deletion_variants(name)):
+            h = _variant_hash(variant)
+            i = bisect_left(variants, h << _ID_BITS)
+            end = bisect_left(variants, (h + 1) << _ID_BITS)
+            for packed in variants[i:end]:
+                yield packed & ((1 << _ID_BITS) - 1)
+
+    def closest(self, query: str, cutoff: float = 0.75) -> Optional[str]:
+        key = normalize(query)
+        if not key:
+            return None
+        self.load()
+
+        name, _, country = key.partition(", ")
+        matcher = SequenceMatcher(b=name, autojunk=False)
+        best_ratio, best_name = cutoff, None
+        for name_id in set(self._candidates(name)):
+            candidate = self._names[name_id]
+            matcher.set_seq1(candidate)
+            ratio = matcher.ratio()
+            if ratio < best_ratio:
+                continue
+            if (
+                best_name is None
+                or ratio > best_ratio
+                or self._exact[candidate] < self._exact[best_name]
+            ):
+                best_ratio, best_name = ratio, candidate
+
+        if best_name is None:
+            return None
+        entry = self._exact.get(f"{best_name}, {country}", self._exact[best_name])
+        return self._labels[entry]
@@ -3,31 +3,39 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-class Config:
-    API_KEY = os.getenv("OPENWEATHER_API_KEY", "")
-    BASE_URL = os.getenv(
-        "OPENWEATHER_BASE_URL", 
-        "https://api.openweathermap.org/data/2.5/weather"
-    )
-    FORECAST_URL = os.getenv(
-        "OPENWEATHER_FORECAST_URL",
-        "https://api.openweathermap.org/data/2.5/forecast"
-    )
+import core_path  # noqa: E402,F401
+from weather_core.config import CoreConfig  # noqa: E402
+
+
+class Config(CoreConfig):
+    # service settings (API, transport, cache, rate limit) come from CoreConfig
+
+    ASSETS_DIR = os.path.join(os.path.dirname(__file__), "assets")
+    CITY_INDEX_FILE = os.path.join(ASSETS_DIR, "cities.txt")
+    ICON_DIR = os.path.join(ASSETS_DIR, "icons")  # served to the client as /icons/...
+    ICON_WARMUP = os.getenv("WEATHER_ICON_WARMUP", "1") != "0"  # fetch missing icons at startup
+    SUGGESTION_LIMIT = 5
 
     APP_TITLE = "Flet Enhanced Weather App"
     APP_WIDTH = 450
     APP_HEIGHT = 750
+    UPDATE_INTERVAL = 1 / 60  # coalesce page updates to at most one per frame
 
-    UNITS = "metric"  
-    TIMEOUT = 10 
+    UNITS = "metric"  # display units; toggled in the UI
 
-    @classmethod
-    def validate(cls):
-        if not cls.API_KEY or cls.API_KEY == "your_api_key_here":
-            raise ValueError(
-                "OPENWEATHER_API_KEY not found or default value used. "
-                "Please check your .env file."
-            )
-        return True
+    # search history ranked by frecency; a search counts half as much after
+    # HISTORY_HALF_LIFE seconds. The dropdown shows the best HISTORY_DROPDOWN.
+    HISTORY_LIMIT = int(os.getenv("WEATHER_HISTORY_LIMIT", "5000"))
+    HISTORY_DROPDOWN = 10
+    HISTORY_HALF_LIFE = 3 * 24 * 3600
 
-Config.validate()
\ No newline at end of file
+    # background refresh for unattended displays: every PREFETCH_INTERVAL
+    # seconds (jittered), refetch the current city and the top
+    # PREFETCH_CITIES history entries that expire within PREFETCH_LEAD
+    # seconds, leaving PREFETCH_RESERVE rate-limit tokens for searches
+    PREFETCH = os.getenv("WEATHER_PREFETCH", "1") != "0"
+    PREFETCH_INTERVAL = float(os.getenv("WEATHER_PREFETCH_INTERVAL", "60"))
+    PREFETCH_LEAD = 90.0
+    PREFETCH_JITTER = 0.2
+    PREFETCH_CITIES = 5
+    PREFETCH_RESERVE = CoreConfig.RATE_LIMIT_BURST / 2
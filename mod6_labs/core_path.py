@@ -0,0 +1,9 @@
+import os
+import sys
+
+# The service core (weather_core/) lives at the repository root and is shared
+# with weather_app. Importing this module makes it importable when the app is
+# started from its own folder (python main.py, flet run).
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
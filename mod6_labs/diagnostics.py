@@ -0,0 +1,83 @@
+import asyncio
+
+import flet as ft
+
+import core_path  # noqa: F401
+from weather_core.telemetry import Telemetry
+
+
+class DiagnosticsPanel:
+    # Hidden view of the telemetry: p50/p95 per stage of the request path
+    # (search, fetch, HTTP connect/wait, decode, render, page.update) and the
+    # cache/retry/error counters. Ctrl+Shift+D shows or hides it. While it is
+    # visible the table is redrawn every `interval` seconds, as a single
+    # text value so each refresh is one small property patch.
+
+    def __init__(self, updates, telemetry: Telemetry, interval: float = 1.0):
+        self.updates = updates
+        self.telemetry = telemetry
+        self.interval = interval
+        self._future = None
+        self.table = ft.Text("", font_family="monospace", size=11, selectable=True)
+        self.counters = ft.Text("", font_family="monospace", size=11, selectable=True)
+        self.control = ft.Container(
+            content=ft.Column(
+                [
+                    ft.Text("Diagnostics (Ctrl+Shift+D)", size=14, weight=ft.FontWeight.BOLD),
+                    self.table,
+                    self.counters,
+                ],
+                spacing=6,
+            ),
+            visible=False,
+            bgcolor=ft.Colors.GREY_100,
+            border_radius=10,
+            padding=10,
+        )
+
+    def on_keyboard_event(self, e: ft.KeyboardEvent) -> bool:
+        if e.ctrl and e.shift and e.key.upper() == "D":
+            self.toggle(e.page)
+            return True
+        return False
+
+    def toggle(self, page: ft.Page):
+        self.control.visible = not self.control.visible
+        if self.control.visible:
+            self.refresh()
+            self._future = page.run_task(self._run)
+        else:
+            self.stop()
+        self.updates.mark_dirty()
+
+    def stop(self):
+        if self._future is not None:
+            self._future.cancel()
+            self._future = None
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            self.refresh()
+
+    def refresh(self):
+        table = self.format_table(self.telemetry.snapshot())
+        counters = self.format_counters(self.telemetry.counters())
+        if table != self.table.value or counters != self.counters.value:
+            self.table.value = table
+            self.counters.value = counters
+            self.updates.mark_dirty()
+
+    @staticmethod
+    def format_table(snapshot) -> str:
+        if not snapshot:
+            return "no requests yet"
+        lines = [f"{'stage':<18}{'n':>6}{'p50 ms':>9}{'p95 ms':>9}"]
+        for name in sorted(snapshot):
+            s = snapshot[name]
+            lines.append(f"{name:<18}{s['count']:>6}{s['p50_ms']:>9.1f}{s['p95_ms']:>9.1f}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def format_counters(counters) -> str:
+        return "  ".join(f"{name}={value:g}" for name, value in sorted(counters.items()))
@@ -0,0 +1,74 @@
+import time
+from array import array
+from collections import Counter
+from datetime import date, timedelta
+from math import fsum
+from typing import List, Optional
+
+import core_path  # noqa: F401
+from weather_core.models import DailySummary, Forecast
+
+SECONDS_PER_DAY = 86400
+NOON = 12 * 3600
+_EPOCH = date(1970, 1, 1)
+
+# Daily summaries from the 3-hour forecast slots. Timestamps are the numeric
+# "dt" shifted by the city's UTC offset, so days and "noon" are the city's
+# own rather than the machine's, and no strings are parsed. The per-slot
+# values are unpacked once into typed arrays; since the slots are
+# chronological every day is one contiguous slice, and min/max/sum run over
+# those slices in C.
+
+
+def aggregate_forecast(forecast: Forecast, days: int = 5, now: Optional[float] = None) -> List[DailySummary]:
+    slots = forecast.slots
+    if not slots:
+        return []
+
+    offset = forecast.timezone
+    local = array("q", (slot.dt + offset for slot in slots))
+    temps = array("d", (slot.temp for slot in slots))
+    lows = array("d", (slot.temp_min for slot in slots))
+    highs = array("d", (slot.temp_max for slot in slots))
+    precipitation = array("d", (slot.precipitation for slot in slots))
+    pops = array("d", (slot.pop for slot in slots))
+    conditions = array("l", (slot.condition_id for slot in slots))
+    day_numbers = array("q", (t // SECONDS_PER_DAY for t in local))
+    noon_distance = array("q", (abs(t % SECONDS_PER_DAY - NOON) for t in local))
+
+    today = int(((time.time() if now is None else now) + offset) // SECONDS_PER_DAY)
+
+    summaries = []
+    start = 0
+    count = len(slots)
+    while start < count and len(summaries) < days:
+        day_number = day_numbers[start]
+        end = start + 1
+        while end < count and day_numbers[end] == day_number:
+            end += 1
+
+        if day_number > today:
+            window = noon_distance[start:end]
+            noon = slots[start + window.index(min(window))]
+
+            dominant_id = Counter(conditions[start:end]).most_common(1)[0][0]
+            dominant = slots[start + conditions[start:end].index(dominant_id)]
+
+            day = _EPOCH + timedelta(days=day_number)
+            summaries.append(DailySummary(
+                date=day,
+                day=day.strftime("%A"),
+                temp=noon.temp,
+                icon=noon.icon,
+                description=noon.description.title(),
+                temp_min=min(lows[start:end]),
+                temp_max=max(highs[start:end]),
+                temp_mean=fsum(temps[start:end]) / (end - start),
+                precipitation=fsum(precipitation[start:end]),
+                pop=max(pops[start:end]),
+                condition_id=dominant_id,
+                condition=dominant.description.title(),
+            ))
+        start = end
+
+    return summaries
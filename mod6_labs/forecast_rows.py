@@ -0,0 +1,79 @@
+from typing import Callable, List
+
+import flet as ft
+
+from icon_cache import ICON_URL
+
+IconSource = Callable[[str], str]
+
+
+class ForecastRow:
+    # One forecast line whose controls are created once and rebound to new
+    # values on every refresh.
+
+    __slots__ = ("container", "label", "icon", "description", "temp", "range", "icon_src")
+
+    def __init__(self, icon_src: IconSource = ICON_URL.format):
+        self.icon_src = icon_src
+        self.label = ft.Text("", size=16, weight=ft.FontWeight.BOLD, width=80)
+        self.icon = ft.Image(src=icon_src("01d"), width=50, height=50)
+        self.description = ft.Text("", size=14, color=ft.Colors.GREY_700, expand=True)
+        self.temp = ft.Text("", size=18, weight=ft.FontWeight.BOLD)
+        self.range = ft.Text("", size=12, color=ft.Colors.GREY_700)
+        self.container = ft.Container(
+            content=ft.Row(
+                [
+                    self.label,
+                    self.icon,
+                    self.description,
+                    ft.Column(
+                        [self.temp, self.range],
+                        spacing=0,
+                        horizontal_alignment=ft.CrossAxisAlignment.END,
+                    ),
+                ],
+                alignment=ft.MainAxisAlignment.SPACE_BETWEEN
+            ),
+            padding=ft.padding.symmetric(vertical=5, horizontal=10),
+            border=ft.border.only(bottom=ft.border.BorderSide(0.5, ft.Colors.BLACK12)),
+            visible=False,
+        )
+
+    def bind(self, label: str, icon: str, description: str, temp: str, range_text: str = ""):
+        # Flet only marks an attribute dirty when its value changes, so rows
+        # that look the same as last time send nothing on page.update()
+        self.label.value = label
+        self.icon.src = self.icon_src(icon)
+        self.description.value = description
+        self.temp.value = temp
+        self.range.value = range_text
+        self.range.visible = bool(range_text)
+        self.container.visible = True
+
+
+class RowPool:
+    # Fixed set of ForecastRows shared by every refresh. The pool only grows
+    # when a view needs more rows than it has ever shown (e.g. switching to
+    # the 40-slot view); after that, refreshes allocate no controls at all.
+
+    def __init__(self, column: ft.Column, size: int = 5, icon_src: IconSource = ICON_URL.format):
+        self.column = column
+        self.icon_src = icon_src
+        self.rows: List[ForecastRow] = []
+        self.reserve(size)
+
+    def reserve(self, size: int):
+        while len(self.rows) < size:
+            row = ForecastRow(self.icon_src)
+            self.rows.append(row)
+            self.column.controls.append(row.container)
+
+    def acquire(self, count: int) -> List[ForecastRow]:
+        # rows [0, count) are bound by the caller; the rest are hidden
+        self.reserve(count)
+        for row in self.rows[count:]:
+            row.container.visible = False
+        return self.rows[:count]
+
+    def __len__(self):
+        return len(self.rows)
@@ -0,0 +1,208 @@
+import asyncio
+import heapq
+import json
+import math
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import core_path  # noqa: F401
+from weather_core.files import atomic_write
+
+
+@dataclass
+class HistoryEntry:
+    __slots__ = ("city", "hits", "first_seen", "last_seen", "score")
+    city: str
+    hits: int
+    first_seen: float
+    last_seen: float
+    score: float
+
+    @classmethod
+    def from_json(cls, item, half_life: float, position: int = 0) -> "HistoryEntry":
+        if isinstance(item, str):
+            # the old format was a bare MRU list of names; keep its order
+            return cls(city=item, hits=1, first_seen=0.0, last_seen=0.0, score=-float(position))
+        hits = int(item.get("hits", 1))
+        last_seen = float(item.get("last_seen", 0.0))
+        score = item.get("score")
+        if score is None:
+            score = math.log2(max(hits, 1)) + last_seen / half_life
+        return cls(
+            city=item["city"],
+            hits=hits,
+            first_seen=float(item.get("first_seen", 0.0)),
+            last_seen=last_seen,
+            score=float(score),
+        )
+
+    def to_json(self) -> Dict:
+        return {"city": self.city, "hits": self.hits, "first_seen": self.first_seen,
+                "last_seen": self.last_seen, "score": self.score}
+
+
+def _log2_add(a: float, b: float) -> float:
+    # log2(2**a + 2**b) without overflowing for large exponents
+    if a < b:
+        a, b = b, a
+    return a + math.log2(1.0 + 2.0 ** (b - a))
+
+
+def _score(entry: HistoryEntry) -> float:
+    return entry.score
+
+
+class HistoryStore:
+    # Searched cities ranked by frecency, persisted to a JSON file.
+    #
+    # Every search adds 2**(t / half_life) to a city's weight. Dividing all
+    # weights by the same decay factor does not change their order, so the
+    # ranking can use the undecayed sum, kept as a log2 score. A score only
+    # grows when its city is searched and never changes otherwise. That makes
+    # touch() O(1) plus an O(k) fix-up of the cached top-k list, and pruning
+    # down to `limit` entries only has to run once per `limit // 4` new
+    # cities.
+    #
+    # touch() only updates memory; a debounced writer on the event loop
+    # snapshots the records and writes them from a worker thread through a
+    # temp file + os.replace, so a crash never leaves a half-written file and
+    # the loop never waits on disk.
+
+    def __init__(self, path, limit: int = 5000, top_k: int = 10,
+                 half_life: float = 3 * 24 * 3600, delay: float = 0.5,
+                 clock: Callable[[], float] = time.time):
+        self.path = Path(path)
+        self.limit = max(limit, top_k)
+        self.top_k = top_k
+        self.half_life = half_life
+        self.delay = delay
+        self._clock = clock
+        self._slack = max(self.limit // 4, 1)
+        self._entries: Dict[str, HistoryEntry] = {}
+        self._top: List[HistoryEntry] = []
+        self._last: Optional[str] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._writing: Optional[asyncio.Future] = None
+        self._dirty = False
+        self.writes = 0
+        self.errors = 0
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                records = json.load(f)
+            if not isinstance(records, list):
+                raise ValueError("history must be a list")
+            entries = [HistoryEntry.from_json(item, self.half_life, i) for i, item in enumerate(records)]
+        except FileNotFoundError:
+            return self
+        except (ValueError, KeyError, TypeError, AttributeError):
+            # keep the unreadable file for inspection instead of silently
+            # overwriting it with an empty history on the next save
+            os.replace(self.path, self.path.with_name(self.path.name + ".corrupt"))
+            return self
+        self._entries = {entry.city: entry for entry in entries}
+        self._prune()
+        if entries:
+            self._last = max(entries, key=lambda e: e.last_seen).city
+        return self
+
+    def top(self, n: Optional[int] = None) -> List[str]:
+        # best first; at most top_k entries
+        return [entry.city for entry in self._top[:n]]
+
+    def most_recent(self) -> Optional[str]:
+        return self._last if self._last in self._entries else None
+
+    def entries(self) -> List[HistoryEntry]:
+        return list(self._entries.values())
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, city):
+        return city in self._entries
+
+    def touch(self, city: str):
+        now = self._clock()
+        weight = now / self.half_life
+        entry = self._entries.get(city)
+        if entry is None:
+            entry = HistoryEntry(city=city, hits=0, first_seen=now, last_seen=now, score=weight)
+            self._entries[city] = entry
+        else:
+            entry.score = _log2_add(entry.score, weight)
+        entry.hits += 1
+        entry.last_seen = now
+        self._last = city
+        self._promote(entry)
+        if len(self._entries) > self.limit + self._slack:
+            self._prune()
+        self._schedule()
+
+    def _promote(self, entry: HistoryEntry):
+        # only `entry` changed and its score only went up, so the rest of the
+        # cached top-k is still correct
+        top = self._top
+        if any(e is entry for e in top):
+            pass
+        elif len(top) < self.top_k:
+            top.append(entry)
+        elif entry.score > top[-1].score:
+            top[-1] = entry
+        else:
+            return
+        top.sort(key=_score, reverse=True)
+
+    def _prune(self):
+        if len(self._entries) > self.limit:
+            keep = heapq.nlargest(self.limit, self._entries.values(), key=_score)
+            self._entries = {entry.city: entry for entry in keep}
+        self._top = heapq.nlargest(self.top_k, self._entries.values(), key=_score)
+
+    def _schedule(self):
+        # called on the event loop; the timer is only re-armed once the
+        # current write (if any) has finished
+        self._dirty = True
+        self._loop = asyncio.get_running_loop()
+        if self._timer is None and self._writing is None:
+            self._timer = self._loop.call_later(self.delay, self._start_write)
+
+    def _snapshot(self) -> List[Dict]:
+        self._dirty = False
+        return [entry.to_json() for entry in self._entries.values()]
+
+    def _start_write(self):
+        self._timer = None
+        self._writing = asyncio.ensure_future(asyncio.to_thread(self._write, self._snapshot()))
+        self._writing.add_done_callback(self._write_done)
+
+    def _write_done(self, task: asyncio.Future):
+        self._writing = None
+        if not task.cancelled() and task.exception() is not None:
+            self.errors += 1
+            self._dirty = True  # retry with the next change or flush
+            return
+        if self._dirty:
+            self._timer = self._loop.call_later(self.delay, self._start_write)
+
+    def _write(self, records: List[Dict]):
+        atomic_write(self.path, json.dumps(records), fsync=True)
+        self.writes += 1
+
+    async def flush(self):
+        # write any pending change now; used when the session closes
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._writing is not None:
+            await asyncio.wait({self._writing})
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        if self._dirty:
+            await asyncio.to_thread(self._write, self._snapshot())
@@ -0,0 +1,141 @@
+import asyncio
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set
+
+import httpx
+
+import core_path  # noqa: F401
+from weather_core.files import atomic_write
+
+ICON_URL = "https://openweathermap.org/img/wn/{}@2x.png"
+
+# OpenWeather's whole icon set: 9 conditions, day and night variants
+ICON_CODES = [
+    f"{code}{variant}"
+    for code in ("01", "02", "03", "04", "09", "10", "11", "13", "50")
+    for variant in ("d", "n")
+]
+
+
+class IconCache:
+    # Weather icons stored once under the Flet assets directory, so rendering
+    # never hot-links openweathermap.org.
+    #
+    # Files are content-addressed (sha256 of the PNG), which also collapses
+    # the day/night pairs that ship identical images. index.json maps icon
+    # codes to file names. src() returns the local asset path for a known
+    # code. For an unknown code it returns the remote URL once and downloads
+    # the icon in the background, so the next render is local. Running this
+    # module directly fetches the whole set ahead of time, for machines that
+    # will run offline.
+
+    def __init__(self, directory, prefix: str = "/icons", url_template: str = ICON_URL):
+        self.directory = Path(directory)
+        self.prefix = prefix
+        self.url_template = url_template
+        self.index_path = self.directory / "index.json"
+        self._index: Dict[str, str] = {}
+        self._pending: Set[str] = set()
+        self._client: Optional[httpx.AsyncClient] = None
+        self.downloads = 0
+        self.failures = 0
+
+    def load(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return self
+        self._index = {
+            code: name for code, name in index.items()
+            if (self.directory / name).is_file()
+        }
+        return self
+
+    def __contains__(self, code: str) -> bool:
+        return code in self._index
+
+    def src(self, code: str) -> str:
+        name = self._index.get(code)
+        if name is not None:
+            return f"{self.prefix}/{name}"
+        self._schedule(code)
+        return self.url_template.format(code)
+
+    def _schedule(self, code: str):
+        if code in self._pending:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # no loop in this thread; warm() will pick it up
+        self._pending.add(code)
+        loop.create_task(self.fetch(code))
+
+    async def fetch(self, code: str) -> bool:
+        self._pending.add(code)
+        try:
+            if self._client is None:
+                self._client = httpx.AsyncClient(timeout=10, follow_redirects=True)
+            response = await self._client.get(self.url_template.format(code))
+            response.raise_for_status()
+            name = await asyncio.to_thread(self._store, response.content)
+        except (httpx.HTTPError, OSError):
+            self.failures += 1
+            return False
+        finally:
+            self._pending.discard(code)
+        self._index[code] = name
+        self.downloads += 1
+        await asyncio.to_thread(self._write_index, dict(self._index))
+        return True
+
+    async def warm(self, codes: Iterable[str] = ICON_CODES, concurrency: int = 4) -> int:
+        # download every missing icon; returns how many are now cached
+        missing = [code for code in codes if code not in self._index and code not in self._pending]
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(code):
+            async with semaphore:
+                await self.fetch(code)
+
+        await asyncio.gather(*(one(code) for code in missing))
+        return len(self._index)
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _store(self, content: bytes) -> str:
+        name = hashlib.sha256(content).hexdigest()[:16] + ".png"
+        path = self.directory / name
+        if not path.exists():
+            self.directory.mkdir(parents=True, exist_ok=True)
+            atomic_write(path, content)
+        return name
+
+    def _write_index(self, index: Dict[str, str]):
+        data = json.dumps(index, indent=1, sort_keys=True).encode()
+        atomic_write(self.index_path, data)
+
+
+async def _bundle(directory) -> int:
+    cache = IconCache(directory).load()
+    try:
+        cached = await cache.warm()
+    finally:
+        await cache.aclose()
+    print(f"{cached}/{len(ICON_CODES)} icons in {directory} "
+          f"({cache.downloads} downloaded, {cache.failures} failed)")
+    return 0 if cached == len(ICON_CODES) else 1
+
+
+if __name__ == "__main__":
+    # python icon_cache.py [directory]: pre-bundle the icon set
+    from config import Config
+
+    sys.exit(asyncio.run(_bundle(sys.argv[1] if len(sys.argv) > 1 else Config.ICON_DIR)))
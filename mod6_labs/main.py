@@ -1,64 +1,161 @@
+import time
+_STARTED = time.perf_counter()
+
+import os
+import core_path  # noqa: F401  (makes weather_core importable)
+from weather_core.startup_profile import StartupProfile
+profile = StartupProfile(_STARTED, cwd=os.path.dirname(os.path.abspath(__file__)))
+
 import flet as ft
-import asyncio
-from datetime import datetime
-import json
+profile.mark("import flet")
+
 from pathlib import Path
-from weather_service import WeatherService, WeatherServiceError
+from city_index import CityIndex
+from diagnostics import DiagnosticsPanel
+from forecast import aggregate_forecast
+from forecast_rows import RowPool
+from history import HistoryStore
+from icon_cache import IconCache
+from refresh import RefreshScheduler
 from config import Config
+from weather_core.models import CurrentConditions, Forecast
+from weather_core.telemetry import telemetry
+from weather_core.update_scheduler import UpdateScheduler
+import units
+# weather_core.service (httpx pool, JSON backends, caches) is imported on first use
+profile.mark("import app modules")
 
 
 class WeatherApp:
 
     def __init__(self, page: ft.Page):
         self.page = page
-        self.weather_service = WeatherService()
+        self.updates = UpdateScheduler(page, Config.UPDATE_INTERVAL)
+        self._weather_service = None
+        self._refresh_future = None
+        self.icons = IconCache(Config.ICON_DIR).load()
         self.current_city = ""
+        self.city_index = CityIndex(Config.CITY_INDEX_FILE)
+        self._unverified_city = None
+        self.units = Config.UNITS
+        self.current_data = None
+        self.forecast_data = None
+        self._search_future = None
+        self._search_seq = 0
         
-        self.history_file = Path("search_history.json")
-        self.search_history = self._load_history()
+        self.history = HistoryStore(
+            Path("search_history.json"),
+            limit=Config.HISTORY_LIMIT,
+            top_k=Config.HISTORY_DROPDOWN,
+            half_life=Config.HISTORY_HALF_LIFE,
+        ).load()
 
         self.setup_page()
         self.build_ui()
-        
-    def _load_history(self):
-        if self.history_file.exists():
-            try:
-                with open(self.history_file, 'r') as f:
-                    return json.load(f)
-            except json.JSONDecodeError:
-                return []
-        return []
-
-    def _save_history(self):
-        with open(self.history_file, 'w') as f:
-            json.dump(self.search_history, f)
+
+        # A disconnect can still be resumed (e.g. a wall display whose
+        # websocket drops), so it only saves the history; the service, its
+        # pooled HTTP client and the refresher are released when the session
+        # itself closes.
+        self.page.on_disconnect = self._save_history
+        self.page.on_close = self._close_service
+        self.page.run_thread(self.city_index.prepare)
+
+        if self.history:
+            self.current_city = self.history.most_recent() or self.history.top(1)[0]
+            self.page.run_task(self._show_cached_then_refresh)
+
+        # fetch any icons not stored locally yet, once, after the first frame
+        if Config.ICON_WARMUP:
+            self.page.run_task(self._warm_icons)
+
+    @property
+    def weather_service(self):
+        # Loaded on first use (the startup cache read or the first search) so
+        # the window paints before the service's dependencies are imported.
+        if self._weather_service is None:
+            from weather_core.service import WeatherService
+
+            self._weather_service = WeatherService(Config)
+            profile.mark("weather service loaded")
+            if Config.PREFETCH:
+                # keep the current city and the favourites warm for unattended displays
+                self.refresher = RefreshScheduler(
+                    self._weather_service,
+                    self._prefetch_targets,
+                    self._on_refreshed,
+                    interval=Config.PREFETCH_INTERVAL,
+                    lead=Config.PREFETCH_LEAD,
+                    jitter=Config.PREFETCH_JITTER,
+                    reserve=Config.PREFETCH_RESERVE,
+                )
+                self._refresh_future = self.page.run_task(self.refresher.run)
+        return self._weather_service
+
+    async def _show_cached_then_refresh(self):
+        # stale-while-revalidate: paint the last stored result for the most
+        # recent city immediately, then refresh it quietly in the background
+        stale = await self.weather_service.get_stale(self.current_city)
+        if stale is None:
+            return
+        current_data, forecast_data, _ = stale
+        self.city_input.value = self.current_city
+        self.display_current_weather(current_data)
+        self.display_5day_forecast(forecast_data)
+        profile.mark("first weather (stored)", once=True)
+        await self.get_weather(background=True)
+
+    def _prefetch_targets(self):
+        return [self.current_city, *self.history.top(Config.PREFETCH_CITIES)]
+
+    def _on_refreshed(self, city, current_data, forecast_data):
+        # repaint only the city on screen, and never under a running search
+        if self.loading.visible or city.casefold() != self.current_city.casefold():
+            return
+        if self.current_data is None:
+            return  # showing an error or nothing yet; leave that to the user
+        self.display_current_weather(current_data)
+        self.display_5day_forecast(forecast_data)
+
+    async def _warm_icons(self):
+        await self.icons.warm()
+        await self.icons.aclose()
+
+    def _save_history(self, e):
+        self.page.run_task(self.history.flush)
+
+    def _close_service(self, e):
+        self.diagnostics.stop()
+        self.page.run_task(self.icons.aclose)
+        if self._refresh_future is not None:
+            self._refresh_future.cancel()
+        self.page.run_task(self.history.flush)
+        if self._weather_service is not None:
+            self.page.run_task(self._weather_service.aclose)
 
     def _add_to_history(self, city: str):
         city = city.strip()
         if not city:
             return
-            
-        if city in self.search_history:
-            self.search_history.remove(city)
 
-        self.search_history.insert(0, city)
-        self.search_history = self.search_history[:10]
-        self._save_history()
+        # memory only; the store writes the file later from a worker thread
+        self.history.touch(city)
         self._update_history_dropdown()
 
     def _update_history_dropdown(self):
-        self.history_dropdown.options = [
-            ft.dropdown.Option(city) for city in self.search_history
-        ]
-        self.page.update()
+        top = self.history.top()
+        if top == [option.key for option in self.history_dropdown.options]:
+            return
+        self.history_dropdown.options = [ft.dropdown.Option(city) for city in top]
+        self.updates.mark_dirty()
     
     def _on_history_select(self, e):
         if e.control.value:
             self.city_input.value = e.control.value
             self.current_city = e.control.value
-            self.page.run_task(self.get_weather)
+            self._start_search()
             e.control.value = None
-            self.page.update()
+            self.updates.mark_dirty()
             
 
     def setup_page(self):
@@ -83,7 +180,7 @@ class WeatherApp:
 
         self.unit_toggle = ft.Switch(
             label="°C / °F",
-            value=False,
+            value=self.units == units.IMPERIAL,
             tooltip="Toggle temperature unit",
             on_change=self.toggle_units,
         )
@@ -99,8 +196,11 @@ class WeatherApp:
             prefix_icon=ft.Icons.LOCATION_CITY,
             autofocus=True,
             on_submit=self.on_search, 
+            on_change=self._on_city_input_change,
         )
 
+        self.suggestions = ft.Column(spacing=0, visible=False)
+
         self.search_button = ft.ElevatedButton(
             "Get Weather",
             icon=ft.Icons.SEARCH,
@@ -111,7 +211,7 @@ class WeatherApp:
         self.history_dropdown = ft.Dropdown(
             label="Search History",
             hint_text="Select a recent city",
-            options=[ft.dropdown.Option(city) for city in self.search_history],
+            options=[ft.dropdown.Option(city) for city in self.history.top()],
             on_change=self._on_history_select,
             width=200
         )
@@ -126,6 +226,7 @@ class WeatherApp:
             bgcolor=ft.Colors.BLUE_50, 
             border_radius=10,
             padding=20,
+            content=self.build_current_weather_card(),
         )
 
         self.forecast_container = ft.Container(
@@ -144,6 +245,11 @@ class WeatherApp:
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
             ),
         )
+        self.forecast_rows = RowPool(self.forecast_container.content.controls[2], icon_src=self.icons.src)
+
+        # hidden until Ctrl+Shift+D
+        self.diagnostics = DiagnosticsPanel(self.updates, telemetry)
+        self.page.on_keyboard_event = self.diagnostics.on_keyboard_event
 
         self.page.add(
             ft.Column(
@@ -152,18 +258,20 @@ class WeatherApp:
                     ft.Row([self.history_dropdown, ft.Container(width=10), self.unit_toggle], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
                     ft.Divider(height=10, color=ft.Colors.TRANSPARENT),
                     self.city_input,
+                    self.suggestions,
                     ft.Row([self.search_button], alignment=ft.MainAxisAlignment.CENTER),
                     ft.Divider(height=10, color=ft.Colors.TRANSPARENT),
                     self.loading,
                     self.error_message,
                     self.current_weather_container,
                     self.forecast_container,
+                    self.diagnostics.control,
                 ],
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                 spacing=10,
             )
         )
-        self.page.update()
+        self.updates.mark_dirty()
 
 
     def _get_weather_theme(self, condition_id: int):
@@ -191,98 +299,172 @@ class WeatherApp:
         else:
             self.page.theme_mode = ft.ThemeMode.LIGHT
             self.theme_button.icon = ft.Icons.DARK_MODE
-        self.page.update()
+        self.updates.mark_dirty()
 
     def toggle_units(self, e):
-        Config.UNITS = "imperial" if e.control.value else "metric"
-        unit_symbol = "F" if Config.UNITS == "imperial" else "C"
-        self.page.title = f"Flet Weather App (°{unit_symbol})"
-        self.page.update()
-        
-        if self.current_city:
-            self.page.run_task(self.get_weather)
+        self.units = units.IMPERIAL if e.control.value else units.METRIC
+        self.page.title = f"Flet Weather App ({units.temp_symbol(self.units)})"
+
+        # re-render the payloads on screen; no network round trip. A search
+        # in progress hides them and renders its result in the new units.
+        if self.current_data is not None and self.current_weather_container.visible:
+            self.display_current_weather(self.current_data)
+        if self.forecast_data is not None and self.forecast_container.visible:
+            self.display_5day_forecast(self.forecast_data)
+        self.updates.mark_dirty()
+
+    def _on_city_input_change(self, e):
+        self._show_suggestions(self.city_index.suggest(e.control.value, Config.SUGGESTION_LIMIT))
+
+    def _show_suggestions(self, cities):
+        self.suggestions.controls = [
+            ft.TextButton(city, on_click=lambda e, c=city: self._pick_suggestion(c))
+            for city in cities
+        ]
+        self.suggestions.visible = bool(cities)
+        self.updates.mark_dirty()
+
+    def _pick_suggestion(self, city: str):
+        self.city_input.value = city
+        self.current_city = city
+        self._show_suggestions([])
+        self._start_search()
+
+    def _validate_city(self, query: str):
+        # Normalize against the bundled index before touching the network.
+        # A near miss is reported as "did you mean" instead of costing a 404
+        # round trip; submitting the same text again sends it anyway, since
+        # the index only has a few hundred cities. A known name with a country
+        # the index does not list (e.g. "Paris, US") goes straight through.
+        if not query:
+            return query
+        resolved = self.city_index.resolve(query)
+        if resolved is not None:
+            return resolved
+        if self.city_index.has_name(query):
+            return query
+        guess = self.city_index.closest(query)
+        if guess is None or query == self._unverified_city:
+            return query
+        self._unverified_city = query
+        self.show_error(
+            f"'{query}' is not in the local city list. Did you mean {guess}? "
+            f"Search again to look up '{query}' anyway."
+        )
+        self._show_suggestions([guess])
+        return None
 
     def on_search(self, e):
-        self.current_city = self.city_input.value.strip()
-        self.page.run_task(self.get_weather) 
+        city = self._validate_city(self.city_input.value.strip())
+        if city is None:
+            return
+        self._unverified_city = None
+        self.city_input.value = city
+        self.current_city = city
+        self._show_suggestions([])
+        self._start_search()
+
+    def _start_search(self):
+        # only the latest search may render; drop the one still in flight
+        if self._search_future is not None and not self._search_future.done():
+            self._search_future.cancel()
+        self._search_future = self.page.run_task(self.get_weather)
+
+    async def get_weather(self, background: bool = False):
+        # one "search" span per call; fetch, render and the service's own
+        # stages (cache, HTTP, decode) are recorded under it
+        with telemetry.span("search", background=background) as span:
+            await self._search(background, span)
+
+    async def _search(self, background: bool, span):
+        from weather_core.service import WeatherServiceError
 
-    async def get_weather(self):
         city = self.current_city
+        # a foreground search supersedes everything started before it; a
+        # background refresh only renders if nothing newer has started
+        if not background:
+            self._search_seq += 1
+        seq = self._search_seq
 
         if not city:
             self.show_error("Please enter a city name")
             return
 
-        self.loading.visible = True
-        self.error_message.visible = False
-        self.current_weather_container.visible = False
-        self.forecast_container.visible = False
-        self.page.update()
+        if not background:
+            cached = self.weather_service.cached_bundle(city)
+            if cached is not None:
+                # warm cache (usually prefetched): render now, no spinner
+                self.error_message.visible = False
+                self.loading.visible = False
+                self._add_to_history(city)
+                span["cached"] = True
+                with telemetry.span("render"):
+                    self.display_current_weather(cached[0])
+                    self.display_5day_forecast(cached[1])
+                return
+
+            self.loading.visible = True
+            self.error_message.visible = False
+            self.current_weather_container.visible = False
+            self.forecast_container.visible = False
+            self.updates.mark_dirty()
 
         try:
-            current_task = self.weather_service.get_current_weather(city)
-            forecast_task = self.weather_service.get_5day_forecast(city)
-            
-            current_data, forecast_data = await asyncio.gather(current_task, forecast_task)
+            with telemetry.span("fetch"):
+                current_data, forecast_data = await self.weather_service.get_weather_bundle(city)
+            if seq != self._search_seq:
+                span["superseded"] = True
+                return  # superseded by a newer search
             
-            self._add_to_history(city) 
+            if not background:
+                self._add_to_history(city) 
             
-            self.display_current_weather(current_data)
-            self.display_5day_forecast(forecast_data)
+            with telemetry.span("render"):
+                self.display_current_weather(current_data)
+                self.display_5day_forecast(forecast_data)
+            profile.mark("first weather (fetched)", once=True)
 
         except WeatherServiceError as e:
-            self.show_error(str(e))
+            span["error"] = str(e)
+            # a failed background refresh keeps the stale data on screen
+            if not background and seq == self._search_seq:
+                self.show_error(str(e))
         except Exception as e:
-            self.show_error(f"A general error occurred: {e}")
+            span["error"] = str(e)
+            if not background and seq == self._search_seq:
+                self.show_error(f"A general error occurred: {e}")
 
         finally:
-            self.loading.visible = False
-            self.page.update()
-
-    def display_current_weather(self, data: dict):
-        city_name = data.get("name", "Unknown")
-        country = data.get("sys", {}).get("country", "")
-        temp = data.get("main", {}).get("temp", 0)
-        feels_like = data.get("main", {}).get("feels_like", 0)
-        humidity = data.get("main", {}).get("humidity", 0)
-        weather_info = data.get("weather", [{}])[0]
-        icon_code = weather_info.get("icon", "01d")
-        condition_id = weather_info.get("id", 800) 
-        wind_speed = data.get("wind", {}).get("speed", 0)
-        
-        new_color, emoji_desc = self._get_weather_theme(condition_id)
-        self.current_weather_container.bgcolor = new_color
-        
-        unit = "°F" if Config.UNITS == "imperial" else "°C"
-        wind_unit = "mph" if Config.UNITS == "imperial" else "m/s"
-
-        self.current_weather_container.content = ft.Column(
+            if not background and seq == self._search_seq:
+                self.loading.visible = False
+                self.updates.mark_dirty()
+
+    def build_current_weather_card(self):
+        # Built once; display_current_weather only rewrites the values below,
+        # so each refresh sends a small property patch instead of a new tree.
+        self.city_label = ft.Text("", size=24, weight=ft.FontWeight.BOLD)
+        self.weather_icon = ft.Image(src=self.icons.src("01d"), width=100, height=100)
+        self.condition_label = ft.Text("", size=20, italic=True)
+        self.temp_label = ft.Text("", size=48, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_900)
+        self.feels_like_label = ft.Text("", size=16, color=ft.Colors.GREY_700)
+
+        humidity_card = self.create_info_card(ft.Icons.WATER_DROP, "Humidity", "")
+        wind_card = self.create_info_card(ft.Icons.AIR, "Wind Speed", "")
+        self.humidity_value = humidity_card.content.controls[2]
+        self.wind_value = wind_card.content.controls[2]
+
+        return ft.Column(
             [
-                ft.Text(f"{city_name}, {country}", size=24, weight=ft.FontWeight.BOLD),
+                self.city_label,
                 ft.Row(
-                    [
-                        ft.Image(src=f"https://openweathermap.org/img/wn/{icon_code}@2x.png", 
-                                 width=100, height=100), 
-                        ft.Text(f"{emoji_desc}", size=20, italic=True),
-                    ],
+                    [self.weather_icon, self.condition_label],
                     alignment=ft.MainAxisAlignment.CENTER,
                 ),
-
-                ft.Text(
-                    f"{temp:.1f}{unit}",
-                    size=48,
-                    weight=ft.FontWeight.BOLD,
-                    color=ft.Colors.BLUE_900,
-                ),
-
-                ft.Text(f"Feels like {feels_like:.1f}{unit}", size=16, color=ft.Colors.GREY_700),
+                self.temp_label,
+                self.feels_like_label,
                 ft.Divider(),
-
                 ft.Row(
-                    [
-                        self.create_info_card(ft.Icons.WATER_DROP, "Humidity", f"{humidity}%"),
-                        self.create_info_card(ft.Icons.AIR, "Wind Speed", f"{wind_speed:.1f} {wind_unit}"),
-                    ],
+                    [humidity_card, wind_card],
                     alignment=ft.MainAxisAlignment.SPACE_EVENLY,
                 ),
             ],
@@ -290,72 +472,68 @@ class WeatherApp:
             spacing=10,
         )
 
+    def display_current_weather(self, data: CurrentConditions):
+        self.current_data = data
+        city_name = data.city
+        country = data.country
+        temp = data.temp
+        feels_like = data.feels_like
+        humidity = data.humidity
+        icon_code = data.icon
+        condition_id = data.condition_id
+        wind_speed = data.wind_speed
+        
+        new_color, emoji_desc = self._get_weather_theme(condition_id)
+        self.current_weather_container.bgcolor = new_color
+        
+        temp = units.convert_temp(temp, self.units)
+        feels_like = units.convert_temp(feels_like, self.units)
+        wind_speed = units.convert_speed(wind_speed, self.units)
+        unit = units.temp_symbol(self.units)
+        wind_unit = units.speed_symbol(self.units)
+
+        self.city_label.value = f"{city_name}, {country}"
+        self.weather_icon.src = self.icons.src(icon_code)
+        self.condition_label.value = emoji_desc
+        self.temp_label.value = f"{temp:.1f}{unit}"
+        self.feels_like_label.value = f"Feels like {feels_like:.1f}{unit}"
+        self.humidity_value.value = f"{humidity}%"
+        self.wind_value.value = f"{wind_speed:.1f} {wind_unit}"
+
+        if self.current_weather_container.visible:
+            self.updates.mark_dirty()  # already on screen: patch the values in place
+            return
         self.current_weather_container.visible = True
         self.current_weather_container.opacity = 0.0
-        self.page.update()
-        asyncio.get_event_loop().call_later(0.05, lambda: self._animate_fade(self.current_weather_container))
-
+        self.updates.mark_dirty()
+        self._fade_in(self.current_weather_container)
 
-    def display_5day_forecast(self, data: dict):
-        
-        forecast_list = data.get("list", [])
-        daily_forecast = self._process_forecast_data(forecast_list)
-        
-        forecast_cards = []
-        unit = "°F" if Config.UNITS == "imperial" else "°C"
-
-        for entry in daily_forecast:
-            day_name = entry["day"]
-            temp = entry["temp"]
-            icon = entry["icon"]
-            description = entry["description"]
-            
-            card = ft.Container(
-                content=ft.Row(
-                    [
-                        ft.Text(day_name, size=16, weight=ft.FontWeight.BOLD, width=80),
-                        ft.Image(src=f"https://openweathermap.org/img/wn/{icon}@2x.png", width=50, height=50),
-                        ft.Text(description, size=14, color=ft.Colors.GREY_700, expand=True),
-                        ft.Text(f"{temp:.0f}{unit}", size=18, weight=ft.FontWeight.BOLD),
-                    ],
-                    alignment=ft.MainAxisAlignment.SPACE_BETWEEN
-                ),
-                padding=ft.padding.symmetric(vertical=5, horizontal=10),
-                border=ft.border.only(bottom=ft.border.BorderSide(0.5, ft.Colors.BLACK12)),
-            )
-            forecast_cards.append(card)
-        
-        forecast_col = self.forecast_container.content.controls[2]
-        forecast_col.controls = forecast_cards
-        
-        self.forecast_container.visible = True
-        self.forecast_container.opacity = 0.0
-        self.page.update()
-        
-        asyncio.get_event_loop().call_later(0.05, lambda: self._animate_fade(self.forecast_container))
 
-    def _process_forecast_data(self, forecast_list):
-        daily_data = {}
-        today = datetime.now().date()
+    def display_5day_forecast(self, data: Forecast):
+        self.forecast_data = data
+        with telemetry.span("forecast.aggregate"):
+            daily_forecast = aggregate_forecast(data)
         
-        for item in forecast_list:
-            dt_txt = datetime.strptime(item['dt_txt'], '%Y-%m-%d %H:%M:%S')
-            day = dt_txt.date()
-
-            if day == today:
-                continue
+        unit = units.temp_symbol(self.units)
+        rows = self.forecast_rows.acquire(len(daily_forecast))
 
-            if day not in daily_data or abs(dt_txt.hour - 12) < abs(daily_data[day]['dt'].hour - 12):
-                daily_data[day] = {
-                    'dt': dt_txt,
-                    'day': dt_txt.strftime('%A'),
-                    'temp': item['main']['temp'],
-                    'icon': item['weather'][0]['icon'],
-                    'description': item['weather'][0]['description'].title(),
-                }
+        for row, entry in zip(rows, daily_forecast):
+            temp = units.convert_temp(entry.temp, self.units)
+            high = units.convert_temp(entry.temp_max, self.units)
+            low = units.convert_temp(entry.temp_min, self.units)
+            description = entry.description
+            if entry.precipitation > 0:
+                description = f"{description} · {entry.precipitation:.1f} mm"
 
-        return list(daily_data.values())[:5]
+            row.bind(entry.day, entry.icon, description, f"{temp:.0f}{unit}", f"H {high:.0f}° L {low:.0f}°")
 
+        if self.forecast_container.visible:
+            self.updates.mark_dirty()
+            return
+        self.forecast_container.visible = True
+        self.forecast_container.opacity = 0.0
+        self.updates.mark_dirty()
+        self._fade_in(self.forecast_container)
 
     def create_info_card(self, icon, label, value):
         return ft.Container(
@@ -380,25 +558,46 @@ class WeatherApp:
             )
         )
 
+    def _fade_in(self, control: ft.Container):
+        # display_* also run from Flet's handler threads, which have no event
+        # loop of their own; schedule the fade on the page's
+        loop = self.page.loop
+        loop.call_soon_threadsafe(loop.call_later, 0.05, lambda: self._animate_fade(control))
+
     def _animate_fade(self, control: ft.Container):
         control.opacity = 1.0
-        self.page.update()
+        self.updates.mark_dirty()
 
     def show_error(self, message: str):
+        self.current_data = None
+        self.forecast_data = None
         self.error_message.value = f"❌ {message}"
         self.error_message.visible = True
         self.current_weather_container.visible = False
         self.forecast_container.visible = False
-        self.page.update()
+        self.updates.mark_dirty()
 
 
 def main(page: ft.Page):
+    profile.mark("session connected")
     try:
-        WeatherApp(page)
+        Config.validate()
+        app = WeatherApp(page)
+        # build_ui only marks the page dirty; send the first frame now rather
+        # than on the scheduler's next tick, so the mark below is when it left
+        app.updates.flush()
     except ValueError as e:
         page.add(ft.Text(f"Configuration Error: {e}", color=ft.Colors.RED_900))
         page.update()
+    profile.mark("first frame sent")
+    if Config.TELEMETRY_FILE and not telemetry.exporting:
+        # one exporter per process, however many sessions connect
+        telemetry.configure(Config.TELEMETRY_FILE, Config.TELEMETRY_INTERVAL)
+        page.run_task(telemetry.run_exporter)
+    if profile.enabled:
+        page.run_thread(profile.report)
 
 
 if __name__ == "__main__":
-    ft.app(target=main)
\ No newline at end of file
+    profile.mark("ft.app start")
+    ft.app(target=main, assets_dir=Config.ASSETS_DIR)
\ No newline at end of file
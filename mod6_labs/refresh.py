@@ -0,0 +1,86 @@
+import asyncio
+import random
+from typing import TYPE_CHECKING, Callable, Iterable, List, Optional, Tuple
+
+import core_path  # noqa: F401
+from weather_core.models import CurrentConditions, Forecast
+
+if TYPE_CHECKING:  # the service module is only imported once it is needed
+    from weather_core.service import WeatherService
+
+OnRefresh = Callable[[str, CurrentConditions, Forecast], None]
+
+
+class RefreshScheduler:
+    # Keeps a handful of cities warm in the service's memory cache.
+    #
+    # Every `interval` seconds (+/- `jitter`, so several displays sharing a
+    # key do not fire together) it walks the target cities in priority order
+    # and refetches any whose cached bundle expires within `lead` seconds or
+    # is missing altogether. Prefetches go through the service, so they take
+    # tokens from the same rate limiter as user searches. A tick stops early
+    # once fewer than `reserve` tokens are left, which keeps that much burst
+    # free for the person at the screen.
+
+    def __init__(
+        self,
+        service: "WeatherService",
+        targets: Callable[[], Iterable[str]],
+        on_refresh: Optional[OnRefresh] = None,
+        interval: float = 60.0,
+        lead: float = 90.0,
+        jitter: float = 0.2,
+        reserve: float = 5.0,
+    ):
+        self.service = service
+        self.targets = targets
+        self.on_refresh = on_refresh
+        self.interval = interval
+        self.lead = lead
+        self.jitter = jitter
+        self.reserve = reserve
+        self.refreshed = 0
+        self.failed = 0
+        self.deferred = 0
+
+    def _due(self) -> List[Tuple[str, bool]]:
+        # (city, refresh) pairs; refresh=False for cities not cached yet, so
+        # a fresh on-disk copy can still be used
+        due = []
+        seen = set()
+        for city in self.targets():
+            key = " ".join(city.split()).casefold()
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            remaining = self.service.expires_in(city)
+            if remaining is None or remaining <= self.lead:
+                due.append((city, remaining is not None))
+        return due
+
+    async def tick(self):
+        for city, refresh in self._due():
+            if self.service.rate_limiter.available < self.reserve:
+                self.deferred += 1
+                return  # try again next tick
+            try:
+                current, forecast = await self.service.get_weather_bundle(city, refresh=refresh)
+            except Exception:
+                # a failed prefetch keeps whatever is cached; the next tick retries
+                self.failed += 1
+                continue
+            self.refreshed += 1
+            if self.on_refresh is not None:
+                self.on_refresh(city, current, forecast)
+
+    def next_delay(self) -> float:
+        return self.interval * random.uniform(1.0 - self.jitter, 1.0 + self.jitter)
+
+    async def run(self):
+        # runs until cancelled
+        while True:
+            await asyncio.sleep(self.next_delay())
+            await self.tick()
+
+    def stats(self):
+        return {"refreshed": self.refreshed, "failed": self.failed, "deferred": self.deferred}
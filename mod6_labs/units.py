@@ -0,0 +1,25 @@
+# Payloads are always fetched in metric (Config.API_UNITS) and converted for
+# display, so switching between °C and °F never needs another request.
+
+METRIC = "metric"
+IMPERIAL = "imperial"
+
+
+def convert_temp(celsius: float, units: str) -> float:
+    if units == IMPERIAL:
+        return celsius * 9 / 5 + 32
+    return celsius
+
+
+def convert_speed(meters_per_second: float, units: str) -> float:
+    if units == IMPERIAL:
+        return meters_per_second * 2.2369362920544
+    return meters_per_second
+
+
+def temp_symbol(units: str) -> str:
+    return "°F" if units == IMPERIAL else "°C"
+
+
+def speed_symbol(units: str) -> str:
+    return "mph" if units == IMPERIAL else "m/s"
@@ -0,0 +1,250 @@
+"""Headless weather lookups: one NDJSON record per city, streamed as they land.
+
+    python -m weather_cli cities.txt > out.ndjson
+    printf 'Manila\\nCebu\\n' | python -m weather_cli --units imperial --fields city,temp
+
+Cities are read lazily (one per line, blank lines and # comments skipped)
+and fetched by a fixed pool of workers, so memory stays flat for any input
+size. Records come out in completion order. Fresh entries in the on-disk
+cache are reused across runs unless --no-cache is given. Exit status: 0 if
+every city was found, 1 if any failed, 2 if the input could not be read.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import threading
+from typing import AsyncIterator, Dict, Iterable, Iterator, List, Optional, TextIO
+
+import units
+from config import Config
+
+CURRENT_FIELDS = [
+    "city", "ok", "error", "name", "country", "temp", "feels_like", "humidity",
+    "wind_speed", "description", "icon", "condition_id", "dt", "timezone",
+    "units", "elapsed_ms",
+]
+FIELDS = CURRENT_FIELDS + ["forecast"]
+
+
+def read_cities(sources: Iterable[TextIO]) -> Iterator[str]:
+    for source in sources:
+        for line in source:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield line
+
+
+class CityReader:
+    # Async iterator over read_cities(sources), read on a daemon thread: a
+    # pipe that is slow to deliver the next line must not hold up the event
+    # loop (and the records of cities already fetched) while it waits. The
+    # bounded queue keeps the thread from reading far ahead of the workers.
+    # Several workers may pull from it at once; a read error is raised to
+    # the one that reaches it.
+
+    _DONE = object()
+
+    def __init__(self, sources: Iterable[TextIO], maxsize: int = 64):
+        self.sources = sources
+        self.maxsize = maxsize
+        self._queue: Optional[asyncio.Queue] = None
+
+    def __aiter__(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue(self.maxsize)
+            loop = asyncio.get_running_loop()
+            threading.Thread(target=self._read, args=(loop,), daemon=True).start()
+        return self
+
+    def _read(self, loop: asyncio.AbstractEventLoop):
+        def put(item):
+            return asyncio.run_coroutine_threadsafe(self._queue.put(item), loop)
+
+        try:
+            for city in read_cities(self.sources):
+                put(city).result()  # waits while the queue is full
+            item = self._DONE
+        except Exception as e:
+            item = e
+        try:
+            put(item)
+        except RuntimeError:
+            pass  # the loop closed before the input ended
+
+    async def __anext__(self) -> str:
+        item = await self._queue.get()
+        if item is self._DONE or isinstance(item, Exception):
+            self._queue.put_nowait(self._DONE)  # wake the other workers
+            if isinstance(item, Exception):
+                raise item
+            raise StopAsyncIteration
+        return item
+
+
+def to_record(result, unit_system: str = units.METRIC, fields: Optional[List[str]] = None) -> Dict:
+    record = {"city": result.city, "ok": result.ok, "error": result.error}
+    current = result.current
+    if current is not None:
+        record.update(
+            name=current.city,
+            country=current.country,
+            temp=round(units.convert_temp(current.temp, unit_system), 2),
+            feels_like=round(units.convert_temp(current.feels_like, unit_system), 2),
+            humidity=current.humidity,
+            wind_speed=round(units.convert_speed(current.wind_speed, unit_system), 2),
+            description=current.description,
+            icon=current.icon,
+            condition_id=current.condition_id,
+            dt=current.dt,
+            timezone=current.timezone,
+            units=unit_system,
+        )
+    if result.forecast is not None:
+        from forecast import aggregate_forecast
+
+        record["forecast"] = [
+            {
+                "date": day.date.isoformat(),
+                "day": day.day,
+                "temp": round(units.convert_temp(day.temp, unit_system), 2),
+                "temp_min": round(units.convert_temp(day.temp_min, unit_system), 2),
+                "temp_max": round(units.convert_temp(day.temp_max, unit_system), 2),
+                "description": day.description,
+                "icon": day.icon,
+                "precipitation": round(day.precipitation, 2),
+                "pop": day.pop,
+            }
+            for day in aggregate_forecast(result.forecast)
+        ]
+    record["elapsed_ms"] = round(result.elapsed * 1000, 1)
+    if fields:
+        record = {field: record.get(field) for field in fields}
+    return record
+
+
+async def iter_results(cities, concurrency: int = 10, forecast: bool = False, service=None):
+    # CityResult objects in completion order; closes the service it created
+    from weather_core.service import WeatherService
+
+    own_service = service is None
+    if own_service:
+        service = WeatherService(Config)
+    try:
+        async for result in service.get_many(cities, concurrency=concurrency, forecast=forecast):
+            yield result
+    finally:
+        if own_service:
+            await service.aclose()
+
+
+async def iter_records(
+    cities: Iterable[str],
+    concurrency: int = 10,
+    forecast: bool = False,
+    unit_system: str = units.METRIC,
+    fields: Optional[List[str]] = None,
+    service=None,
+) -> AsyncIterator[Dict]:
+    # Library entry point: async for record in iter_records(cities): ...
+    async for result in iter_results(cities, concurrency, forecast, service):
+        yield to_record(result, unit_system, fields)
+
+
+def parse_fields(value: str) -> List[str]:
+    fields = [field.strip() for field in value.split(",") if field.strip()]
+    unknown = [field for field in fields if field not in FIELDS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown field(s) {', '.join(unknown)}; choose from {', '.join(FIELDS)}"
+        )
+    return fields
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m weather_cli", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("files", nargs="*", help="files with one city per line ('-' or none: stdin)")
+    parser.add_argument("--concurrency", "-c", type=int, default=10)
+    parser.add_argument("--forecast", action="store_true", help="include the 5-day daily summary")
+    parser.add_argument("--units", choices=[units.METRIC, units.IMPERIAL], default=Config.UNITS)
+    parser.add_argument("--fields", type=parse_fields, help="comma-separated fields to keep")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and do not update the on-disk cache")
+    parser.add_argument("--cache-db", default=Config.CACHE_DB, help="on-disk cache to reuse")
+    return parser.parse_args(argv)
+
+
+def open_sources(names: List[str]) -> List[TextIO]:
+    sources = []
+    try:
+        for name in names:
+            sources.append(sys.stdin if name == "-" else open(name, "r", encoding="utf-8"))
+    except OSError:
+        close_sources(sources)
+        raise
+    return sources
+
+
+def close_sources(sources: List[TextIO]):
+    for source in sources:
+        if source is not sys.stdin:
+            source.close()
+
+
+async def run(args, out: Optional[TextIO] = None, sources: Optional[List[TextIO]] = None) -> int:
+    out = out or sys.stdout
+    sources = sources if sources is not None else [sys.stdin]
+    failed = 0
+    exporter = None
+    if Config.TELEMETRY_FILE:
+        from weather_core.telemetry import telemetry
+
+        exporter = asyncio.ensure_future(telemetry.run_exporter())
+    try:
+        async for result in iter_results(CityReader(sources), args.concurrency, args.forecast):
+            failed += not result.ok
+            record = to_record(result, args.units, args.fields)
+            out.write(json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n")
+            out.flush()  # downstream consumers see each city as it lands
+    finally:
+        if exporter is not None:
+            exporter.cancel()
+    return 1 if failed else 0
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    try:
+        Config.validate()
+    except ValueError as e:
+        print(f"Configuration Error: {e}", file=sys.stderr)
+        return 2
+    Config.CACHE_DB = "" if args.no_cache else args.cache_db
+    try:
+        sources = open_sources(args.files or ["-"])
+    except OSError as e:
+        print(f"Input Error: {e}", file=sys.stderr)
+        return 2
+    telemetry = None
+    if Config.TELEMETRY_FILE:
+        from weather_core.telemetry import telemetry
+
+        telemetry.configure(Config.TELEMETRY_FILE, Config.TELEMETRY_INTERVAL)
+    try:
+        return asyncio.run(run(args, sources=sources))
+    except KeyboardInterrupt:
+        return 130
+    except BrokenPipeError:
+        return 0  # e.g. piped into head
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Input Error: {e}", file=sys.stderr)
+        return 2
+    finally:
+        close_sources(sources)
+        if telemetry is not None:
+            telemetry.flush()  # whatever the exporter had not written yet
+
+
+if __name__ == "__main__":
+    sys.exit(main())
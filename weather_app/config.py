@@ -1,40 +1,28 @@
 # config.py
 """Configuration management for the Weather App."""
 
-import os
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
+# Load environment variables from .env file (before the core reads them)
 load_dotenv()
 
-class Config:
-    """Application configuration."""
+import core_path  # noqa: E402,F401
+from weather_core.config import CoreConfig  # noqa: E402
 
-    # API Configuration
-    API_KEY = os.getenv("OPENWEATHER_API_KEY", "")
-    BASE_URL = os.getenv(
-        "OPENWEATHER_BASE_URL", 
-        "https://api.openweathermap.org/data/2.5/weather"
-    )
+
+class Config(CoreConfig):
+    """Application configuration.
+
+    API, cache and rate-limit settings are inherited from the shared
+    service core (weather_core/config.py).
+    """
 
     # App Configuration
     APP_TITLE = "Flet Weather App"
     APP_WIDTH = 400
     APP_HEIGHT = 600
+    UPDATE_INTERVAL = 1 / 60  # coalesce page updates to at most one per frame
 
     # API Settings
     UNITS = "metric"  # Options: metric (°C), imperial (°F), or standard (K)
-    TIMEOUT = 10  # seconds
-
-    @classmethod
-    def validate(cls):
-        """Validate that required configuration is present."""
-        if not cls.API_KEY or cls.API_KEY == "your_api_key_here":
-            raise ValueError(
-                "OPENWEATHER_API_KEY not found or default value used. "
-                "Please check your .env file."
-            )
-        return True
-
-# Validate configuration on import
-Config.validate()
\ No newline at end of file
+    API_UNITS = UNITS  # requested as displayed, no client-side conversion
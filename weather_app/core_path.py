@@ -0,0 +1,14 @@
+# core_path.py
+"""Make the shared service core importable.
+
+weather_core/ lives at the repository root and is shared with mod6_labs.
+Importing this module adds the root to sys.path, so the app still runs from
+its own folder (python main.py, flet run).
+"""
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
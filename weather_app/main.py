@@ -1,7 +1,22 @@
+import time
+_STARTED = time.perf_counter()
+
+import os
+import core_path  # noqa: F401  (makes weather_core importable)
+from weather_core.startup_profile import StartupProfile
+profile = StartupProfile(_STARTED, cwd=os.path.dirname(os.path.abspath(__file__)))
+
 import flet as ft
+profile.mark("import flet")
+
 import asyncio
-from weather_service import WeatherService, WeatherServiceError
 from config import Config
+from weather_core.models import CurrentConditions
+from weather_core.telemetry import telemetry
+from weather_core.update_scheduler import UpdateScheduler
+
+# weather_core.service (httpx pool, JSON backends, caches) is imported on first search
+profile.mark("import app modules")
 
 
 class WeatherApp:
@@ -9,10 +24,29 @@ class WeatherApp:
 
     def __init__(self, page: ft.Page):
         self.page = page
-        self.weather_service = WeatherService()
+        self._weather_service = None
+        # controls are changed first and sent together, once per frame
+        self.updates = UpdateScheduler(page, Config.UPDATE_INTERVAL)
+        # a disconnect can be resumed; release the service when the session closes
+        self.page.on_close = self._close_service
         self.setup_page()
         self.build_ui()
 
+    @property
+    def weather_service(self):
+        """Create the service on first use, after the window has painted."""
+        if self._weather_service is None:
+            from weather_core.service import WeatherService
+
+            self._weather_service = WeatherService(Config)
+            profile.mark("weather service loaded")
+        return self._weather_service
+
+    def _close_service(self, e):
+        """Release the pooled connections when the session ends."""
+        if self._weather_service is not None:
+            self.page.run_task(self._weather_service.aclose)
+
     def setup_page(self):
         """Configure page settings."""
         self.page.title = Config.APP_TITLE
@@ -93,12 +127,14 @@ class WeatherApp:
         else:
             self.page.theme_mode = ft.ThemeMode.LIGHT
             self.theme_button.icon = ft.Icons.DARK_MODE
-        self.page.update()
+        self.updates.mark_dirty()
 
     def on_search(self, e):
         self.page.run_task(self.get_weather) 
 
     async def get_weather(self):
+        from weather_core.service import WeatherServiceError
+
         city = self.city_input.value.strip()
 
         if not city:
@@ -108,11 +144,15 @@ class WeatherApp:
         self.loading.visible = True
         self.error_message.visible = False
         self.weather_container.visible = False
-        self.page.update()
+        self.updates.mark_dirty()
 
         try:
-            weather_data = await self.weather_service.get_weather(city)
-            await self.display_weather(weather_data)
+            with telemetry.span("search"):
+                with telemetry.span("fetch"):
+                    weather_data = await self.weather_service.get_current_weather(city)
+                with telemetry.span("render"):
+                    await self.display_weather(weather_data)
+            profile.mark("first weather", once=True)
 
         except WeatherServiceError as e:
             self.show_error(str(e))
@@ -121,18 +161,18 @@ class WeatherApp:
 
         finally:
             self.loading.visible = False
-            self.page.update()
+            self.updates.mark_dirty()
 
-    async def display_weather(self, data: dict):
+    async def display_weather(self, data: CurrentConditions):
         
-        city_name = data.get("name", "Unknown")
-        country = data.get("sys", {}).get("country", "")
-        temp = data.get("main", {}).get("temp", 0)
-        feels_like = data.get("main", {}).get("feels_like", 0)
-        humidity = data.get("main", {}).get("humidity", 0)
-        description = data.get("weather", [{}])[0].get("description", "").title()
-        icon_code = data.get("weather", [{}])[0].get("icon", "01d")
-        wind_speed = data.get("wind", {}).get("speed", 0)
+        city_name = data.city
+        country = data.country
+        temp = data.temp
+        feels_like = data.feels_like
+        humidity = data.humidity
+        description = data.description.title()
+        icon_code = data.icon
+        wind_speed = data.wind_speed
         unit = "°C" if Config.UNITS == "metric" else "°F"
 
         self.weather_container.content = ft.Column(
@@ -172,11 +212,12 @@ class WeatherApp:
         self.weather_container.visible = True
         self.weather_container.opacity = 0.0
         self.error_message.visible = False
-        self.page.update()
+        self.updates.mark_dirty()
 
-        await asyncio.sleep(0.05) 
+        # let the transparent frame go out first so the fade-in animates
+        await asyncio.sleep(0.05)
         self.weather_container.opacity = 1.0
-        self.page.update()
+        self.updates.mark_dirty()
 
 
     def create_info_card(self, icon, label, value):
@@ -206,16 +247,27 @@ class WeatherApp:
         self.error_message.value = f"❌ {message}"
         self.error_message.visible = True
         self.weather_container.visible = False
-        self.page.update()
+        self.updates.mark_dirty()
 
 
 def main(page: ft.Page):
+    profile.mark("session connected")
     try:
-        WeatherApp(page)
+        Config.validate()
+        app = WeatherApp(page)
+        app.updates.flush()  # anything still queued goes out with the first frame
     except ValueError as e:
         page.add(ft.Text(f"Configuration Error: {e}", color=ft.Colors.RED_900))
         page.update()
+    profile.mark("first frame sent")
+    if Config.TELEMETRY_FILE and not telemetry.exporting:
+        # export timing spans and counters (see weather_core/telemetry.py)
+        telemetry.configure(Config.TELEMETRY_FILE, Config.TELEMETRY_INTERVAL)
+        page.run_task(telemetry.run_exporter)
+    if profile.enabled:
+        page.run_thread(profile.report)
 
 
 if __name__ == "__main__":
+    profile.mark("ft.app start")
     ft.app(target=main)
\ No newline at end of file
@@ -0,0 +1,13 @@
+# Service core shared by mod6_labs and weather_app.
+#
+#   config.py      CoreConfig: API, transport, cache and rate-limit settings
+#   service.py     WeatherService: builds requests, returns models
+#   middleware.py  cache -> retry -> rate limit -> metrics chain
+#   transport.py   live HTTP, mock:// backend, record/replay
+#   models.py, decoding.py, onecall.py   payload parsing
+#   update_scheduler.py  coalesces the GUIs' page.update() calls
+#   startup_profile.py   the GUIs' --profile-startup timings
+#   files.py       atomic_write, shared by every module that saves a file
+#
+# Nothing is imported here, so importing the config does not pull in httpx
+# before an app has painted its first frame.
@@ -0,0 +1,128 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+from .models import CurrentConditions, Forecast
+
+
+@dataclass
+class CityResult:
+    city: str
+    current: Optional[CurrentConditions] = None
+    forecast: Optional[Forecast] = None
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchSummary:
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    errors: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        return self.total / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.total} cities in {self.elapsed:.2f}s "
+            f"({self.throughput:.1f}/s), {self.succeeded} ok, {self.failed} failed"
+        )
+
+
+class BatchRun:
+    # Async iterator over CityResult objects in completion order. A fixed
+    # pool of `concurrency` workers pulls cities from the input lazily and a
+    # bounded queue applies backpressure, so memory stays flat no matter how
+    # long the input is. `cities` may also be an async iterable (e.g. one fed
+    # from a thread that reads a slow pipe); the workers then take turns
+    # awaiting it, as an async generator cannot be resumed by two at once.
+    # `summary` is complete once iteration finishes. If reading the input
+    # fails, the error is raised from the iteration once the cities already
+    # being fetched have been yielded.
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[CityResult]],
+        cities: Union[Iterable[str], AsyncIterable[str]],
+        concurrency: int,
+    ):
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self._fetch = fetch
+        self._cities = cities
+        self.concurrency = concurrency
+        self.summary = BatchSummary()
+        self._error: Optional[BaseException] = None
+
+    def __aiter__(self) -> AsyncIterator[CityResult]:
+        return self._run()
+
+    async def _worker(self, cities, queue: asyncio.Queue, turn: asyncio.Lock):
+        try:
+            if hasattr(cities, "__anext__"):
+                while True:
+                    async with turn:
+                        try:
+                            city = await cities.__anext__()
+                        except StopAsyncIteration:
+                            break
+                    await self._put(city, queue)
+            else:
+                for city in cities:
+                    await self._put(city, queue)
+        except Exception as e:
+            if self._error is None:
+                self._error = e
+        finally:
+            await queue.put(None)
+
+    async def _put(self, city: str, queue: asyncio.Queue):
+        city = city.strip()
+        if city:
+            await queue.put(await self._fetch(city))
+
+    async def _run(self) -> AsyncIterator[CityResult]:
+        if hasattr(self._cities, "__aiter__"):
+            cities = self._cities.__aiter__()
+        else:
+            cities = iter(self._cities)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.concurrency)
+        turn = asyncio.Lock()
+        start = time.perf_counter()
+        workers: List[asyncio.Task] = [
+            asyncio.ensure_future(self._worker(cities, queue, turn))
+            for _ in range(self.concurrency)
+        ]
+        running = len(workers)
+        try:
+            while running:
+                result = await queue.get()
+                if result is None:
+                    running -= 1
+                    continue
+                self._record(result)
+                yield result
+            if self._error is not None:
+                raise self._error
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self.summary.elapsed = time.perf_counter() - start
+
+    def _record(self, result: CityResult):
+        self.summary.total += 1
+        if result.ok:
+            self.summary.succeeded += 1
+        else:
+            self.summary.failed += 1
+            self.summary.errors[result.error] = self.summary.errors.get(result.error, 0) + 1
@@ -0,0 +1,106 @@
+"""Per-call AsyncClient vs the shared pooled client, against a local stub.
+
+    python weather_core/benchmarks/bench_client.py --searches 50 --connect-delay 0.03
+
+--connect-delay stalls every *new* connection on the stub server to stand
+in for the TCP+TLS handshake a real API round trip pays.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+os.environ.setdefault("OPENWEATHER_API_KEY", "benchmark")
+
+PAYLOAD = json.dumps({"name": "Stub", "main": {"temp": 20.0}}).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connect_delay = 0.0
+
+    def setup(self):
+        time.sleep(self.connect_delay)
+        super().setup()
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_stub(connect_delay: float) -> ThreadingHTTPServer:
+    StubHandler.connect_delay = connect_delay
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def per_call_search(httpx, url):
+    async def fetch():
+        async with httpx.AsyncClient() as client:
+            return (await client.get(url, params={"q": "Stub"})).json()
+
+    return await asyncio.gather(fetch(), fetch())
+
+
+async def run(searches: int, url: str):
+    import httpx
+    from weather_core.config import CoreConfig as Config
+    from weather_core.service import WeatherService
+
+    Config.BASE_URL = Config.FORECAST_URL = url
+    Config.CACHE_DB = ""
+    Config.RATE_LIMIT_PER_MINUTE = 1e9  # measure the client, not the limiter
+
+    start = time.perf_counter()
+    for _ in range(searches):
+        await per_call_search(httpx, url)
+    per_call = (time.perf_counter() - start) / searches
+
+    async with WeatherService(Config) as service:
+        await asyncio.gather(
+            service.get_current_weather("Stub"), service.get_5day_forecast("Stub")
+        )  # warm the pool
+        start = time.perf_counter()
+        for _ in range(searches):
+            # refresh=True: measure the round trip, not the memory cache
+            await asyncio.gather(
+                service.get_current_weather("Stub", refresh=True),
+                service.get_5day_forecast("Stub", refresh=True),
+            )
+        pooled = (time.perf_counter() - start) / searches
+
+    print(f"per-call client : {per_call * 1000:8.2f} ms/search")
+    print(f"pooled client   : {pooled * 1000:8.2f} ms/search")
+    print(f"speedup         : {per_call / pooled:8.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--searches", type=int, default=50)
+    parser.add_argument("--connect-delay", type=float, default=0.03)
+    args = parser.parse_args()
+
+    server = start_stub(args.connect_delay)
+    url = f"http://127.0.0.1:{server.server_address[1]}/data"
+    try:
+        asyncio.run(run(args.searches, url))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
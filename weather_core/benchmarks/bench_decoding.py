@@ -0,0 +1,51 @@
+"""Decode time and allocations for a recorded 40-slot forecast payload,
+per JSON backend (backends that are not installed are skipped).
+
+    python weather_core/benchmarks/bench_decoding.py
+"""
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT.parent))
+
+from weather_core import decoding  # noqa: E402
+from weather_core.models import Forecast  # noqa: E402
+
+
+def allocations(fn, raw):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = fn(raw)
+    after = tracemalloc.take_snapshot()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    del result
+    return blocks, peak
+
+
+def main():
+    raw = (ROOT / "fixtures" / "forecast.json").read_bytes()
+    candidates = [("json.loads + from_json", lambda r: Forecast.from_json(json.loads(r)))]
+    if decoding.orjson is not None:
+        candidates.append(("orjson.loads + from_json", lambda r: Forecast.from_json(decoding.orjson.loads(r))))
+    if decoding.msgspec is not None:
+        candidates.append(("msgspec typed structs", decoding.decode_forecast))
+    print(f"payload: {len(raw)} bytes, active backend: {decoding.BACKEND}\n")
+
+    baseline = None
+    print(f"{'decoder':<26} {'time':>10} {'speedup':>8} {'allocs':>8} {'peak':>10}")
+    for name, fn in candidates:
+        number = 2000
+        seconds = min(timeit.repeat(lambda: fn(raw), number=number, repeat=5)) / number
+        baseline = baseline or seconds
+        blocks, peak = allocations(fn, raw)
+        print(f"{name:<26} {seconds * 1e6:>7.1f} us {baseline / seconds:>7.2f}x {blocks:>8} {peak / 1024:>7.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Parse cost and retained memory per city: raw JSON trees vs slotted models.
+
+    python weather_core/benchmarks/bench_models.py --cities 500
+"""
+import argparse
+import gc
+import json
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from weather_core.models import CurrentConditions, Forecast  # noqa: E402
+from payloads import make_current, make_forecast  # noqa: E402
+
+
+def retained_bytes(build):
+    gc.collect()
+    tracemalloc.start()
+    kept = build()
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cities", type=int, default=500)
+    args = parser.parse_args()
+
+    raw = [
+        (json.dumps(make_current(seed=i)), json.dumps(make_forecast(seed=i)))
+        for i in range(args.cities)
+    ]
+    current_text, forecast_text = raw[0]
+    current_json, forecast_json = json.loads(current_text), json.loads(forecast_text)
+
+    number = 2000
+    parse_current = min(timeit.repeat(lambda: CurrentConditions.from_json(current_json), number=number, repeat=5)) / number
+    parse_forecast = min(timeit.repeat(lambda: Forecast.from_json(forecast_json), number=number // 10, repeat=5)) / (number // 10)
+    print(f"parse current  : {parse_current * 1e6:8.1f} us")
+    print(f"parse forecast : {parse_forecast * 1e6:8.1f} us (40 slots)")
+
+    def keep_dicts():
+        return [(json.loads(c), json.loads(f)) for c, f in raw]
+
+    def keep_models():
+        return [
+            (CurrentConditions.from_json(json.loads(c)), Forecast.from_json(json.loads(f)))
+            for c, f in raw
+        ]
+
+    dict_bytes = retained_bytes(keep_dicts) / args.cities
+    model_bytes = retained_bytes(keep_models) / args.cities
+    print(f"raw dicts      : {dict_bytes / 1024:8.1f} KiB/city")
+    print(f"models         : {model_bytes / 1024:8.1f} KiB/city ({dict_bytes / model_bytes:.1f}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Drive WeatherService against the in-process mock backend and report
+latency percentiles and throughput.
+
+    python weather_core/benchmarks/loadgen.py --requests 2000 --concurrency 50 \\
+        --latency 0.05 --error-rate 0.02 --429-rate 0.01
+
+Every request uses a distinct city so nothing is answered from the caches;
+what is measured is the service layer (rate limiter, retries, pooled
+client, decoding, disk cache writes) plus the simulated network delay.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=1000, help="cities to fetch")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--forecast", action="store_true", help="fetch current + forecast per city")
+    parser.add_argument("--latency", type=float, default=0.05, help="mock response delay, seconds")
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of 5xx responses")
+    parser.add_argument("--429-rate", dest="throttle_rate", type=float, default=0.0,
+                        help="share of 429 responses")
+    parser.add_argument("--retry-after", type=float, default=0.5)
+    parser.add_argument("--rate-limit", type=float, default=0.0,
+                        help="client limiter in calls/minute (0 = effectively off)")
+    return parser.parse_args()
+
+
+def configure(args):
+    # Config reads the environment when it is imported
+    os.environ.setdefault("OPENWEATHER_API_KEY", "loadgen")
+    os.environ["OPENWEATHER_BASE_URL"] = "mock://api/data/2.5/weather"
+    os.environ["OPENWEATHER_FORECAST_URL"] = "mock://api/data/2.5/forecast"
+    os.environ["OPENWEATHER_FETCH_MODE"] = "dual"
+    os.environ["WEATHER_MOCK_LATENCY"] = str(args.latency)
+    os.environ["WEATHER_MOCK_JITTER"] = str(args.jitter)
+    os.environ["WEATHER_MOCK_ERROR_RATE"] = str(args.error_rate)
+    os.environ["WEATHER_MOCK_429_RATE"] = str(args.throttle_rate)
+    os.environ["WEATHER_MOCK_RETRY_AFTER"] = str(args.retry_after)
+    os.environ["OPENWEATHER_RATE_LIMIT"] = str(args.rate_limit or 1e9)
+
+    from weather_core.config import CoreConfig as Config
+
+    Config.CACHE_DB = ":memory:"
+    Config.RATE_LIMIT_BURST = max(Config.RATE_LIMIT_BURST, args.concurrency * 2)
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+async def run(args):
+    from weather_core.config import CoreConfig as Config
+    from weather_core.service import WeatherService
+
+    cities = (f"Loadtest {i}" for i in range(args.requests))
+    latencies = []
+    async with WeatherService(Config) as service:
+        run = service.get_many(cities, concurrency=args.concurrency, forecast=args.forecast)
+        start = time.perf_counter()
+        async for result in run:
+            latencies.append(result.elapsed)
+        elapsed = time.perf_counter() - start
+        stats = service.stats()
+        backend = service.mock_backend.stats()
+
+    latencies.sort()
+    summary = run.summary
+    print(f"requests     {summary.total} ({summary.succeeded} ok, {summary.failed} failed), "
+          f"concurrency {args.concurrency}")
+    print(f"throughput   {summary.total / elapsed:.1f} cities/s over {elapsed:.2f}s")
+    print("latency ms   p50 {:.1f}  p95 {:.1f}  p99 {:.1f}  max {:.1f}  mean {:.1f}".format(
+        *(percentile(latencies, p) * 1000 for p in (50, 95, 99, 100)),
+        statistics.fmean(latencies) * 1000 if latencies else 0.0,
+    ))
+    print(f"backend      {backend['requests']} requests, {backend['errors']} 5xx, "
+          f"{backend['throttled']} 429")
+    print(f"service      {stats['retries']} retries, {stats['errors']} errors, "
+          f"{stats['rate_limiter']['penalties']} limiter penalties")
+    for error, count in sorted(summary.errors.items(), key=lambda item: -item[1])[:5]:
+        print(f"  {count:>6} x {error}")
+
+
+def main():
+    args = parse_args()
+    configure(args)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# Synthetic OpenWeather payloads shaped like real /weather and /forecast
+# responses, for the benchmarks.
+import random
+from datetime import datetime, timezone
+
+CONDITIONS = [
+    (800, "clear sky", "01"),
+    (801, "few clouds", "02"),
+    (803, "broken clouds", "04"),
+    (500, "light rain", "10"),
+    (501, "moderate rain", "10"),
+    (211, "thunderstorm", "11"),
+    (600, "light snow", "13"),
+    (701, "mist", "50"),
+]
+
+
+def _weather(rng, hour):
+    condition_id, description, icon = rng.choice(CONDITIONS)
+    suffix = "d" if 6 <= hour < 18 else "n"
+    return [{"id": condition_id, "main": description.split()[-1].title(),
+             "description": description, "icon": icon + suffix}]
+
+
+def make_forecast(slots=40, start=None, tz_offset=28800, seed=1):
+    rng = random.Random(seed)
+    if start is None:
+        start = int(datetime.now(timezone.utc).timestamp()) // 10800 * 10800
+    items = []
+    for i in range(slots):
+        dt = start + i * 10800
+        hour = datetime.fromtimestamp(dt + tz_offset, tz=timezone.utc).hour
+        temp = round(rng.uniform(18, 33), 2)
+        item = {
+            "dt": dt,
+            "main": {
+                "temp": temp, "feels_like": temp + 1.2,
+                "temp_min": temp - rng.uniform(0, 2), "temp_max": temp + rng.uniform(0, 2),
+                "pressure": 1010, "sea_level": 1010, "grnd_level": 1005,
+                "humidity": rng.randint(50, 95), "temp_kf": 0.4,
+            },
+            "weather": _weather(rng, hour),
+            "clouds": {"all": rng.randint(0, 100)},
+            "wind": {"speed": round(rng.uniform(0, 9), 2), "deg": rng.randint(0, 359),
+                     "gust": round(rng.uniform(0, 14), 2)},
+            "visibility": 10000,
+            "pop": round(rng.random(), 2),
+            "sys": {"pod": "d" if 6 <= hour < 18 else "n"},
+            "dt_txt": datetime.fromtimestamp(dt, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        if item["weather"][0]["id"] < 600:
+            item["rain"] = {"3h": round(rng.uniform(0.1, 6), 2)}
+        items.append(item)
+    return {
+        "cod": "200", "message": 0, "cnt": slots, "list": items,
+        "city": {"id": 1701668, "name": "Manila", "coord": {"lat": 14.6042, "lon": 120.9822},
+                 "country": "PH", "population": 1600000, "timezone": tz_offset,
+                 "sunrise": start, "sunset": start + 43200},
+    }
+
+
+def make_current(name="Manila", country="PH", seed=1):
+    rng = random.Random(seed)
+    temp = round(rng.uniform(18, 33), 2)
+    now = int(datetime.now(timezone.utc).timestamp())
+    return {
+        "coord": {"lon": 120.9822, "lat": 14.6042},
+        "weather": _weather(rng, 12),
+        "base": "stations",
+        "main": {"temp": temp, "feels_like": temp + 2.1, "temp_min": temp - 1, "temp_max": temp + 1,
+                 "pressure": 1009, "humidity": 74, "sea_level": 1009, "grnd_level": 1008},
+        "visibility": 10000,
+        "wind": {"speed": 4.12, "deg": 240, "gust": 6.3},
+        "clouds": {"all": 40},
+        "dt": now,
+        "sys": {"type": 1, "id": 8160, "country": country, "sunrise": now - 20000, "sunset": now + 20000},
+        "timezone": 28800, "id": 1701668, "name": name, "cod": 200,
+    }
@@ -0,0 +1,84 @@
+import os
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class CoreConfig:
+    # Settings of the service core, read from the environment when this
+    # module is imported; each app loads its .env first and subclasses this
+    # with its own UI settings. The service reads whichever class it is given,
+    # so overriding an attribute on the app's Config is enough.
+
+    API_KEY = os.getenv("OPENWEATHER_API_KEY", "")
+    BASE_URL = os.getenv(
+        "OPENWEATHER_BASE_URL",
+        "https://api.openweathermap.org/data/2.5/weather"
+    )
+    FORECAST_URL = os.getenv(
+        "OPENWEATHER_FORECAST_URL",
+        "https://api.openweathermap.org/data/2.5/forecast"
+    )
+    GEOCODE_URL = os.getenv(
+        "OPENWEATHER_GEOCODE_URL",
+        "https://api.openweathermap.org/geo/1.0/direct"
+    )
+    ONECALL_URL = os.getenv(
+        "OPENWEATHER_ONECALL_URL",
+        "https://api.openweathermap.org/data/3.0/onecall"
+    )
+    # "onecall": geocode once, then one coordinate request for current and
+    # forecast data. "dual": the /weather + /forecast pair. One Call needs its
+    # own subscription, so the service drops back to "dual" if it is refused.
+    FETCH_MODE = os.getenv("OPENWEATHER_FETCH_MODE", "dual")
+
+    # "http" talks to the API. "record" does the same and also saves every
+    # successful response under REPLAY_DIR. "replay" answers only from
+    # REPLAY_DIR, for offline runs and repeatable benchmarks.
+    TRANSPORT = os.getenv("OPENWEATHER_TRANSPORT", "http")
+    REPLAY_DIR = os.getenv("WEATHER_REPLAY_DIR", "weather_replay")
+
+    # URLs starting with mock:// are answered in-process by
+    # mock_backend.MockBackend, which serves the synthetic payloads in fixtures/
+    # (e.g. OPENWEATHER_BASE_URL=mock://api/data/2.5/weather)
+    MOCK_FIXTURES = os.path.join(_HERE, "fixtures")
+    MOCK_LATENCY = float(os.getenv("WEATHER_MOCK_LATENCY", "0.05"))  # seconds
+    MOCK_JITTER = float(os.getenv("WEATHER_MOCK_JITTER", "0.02"))
+    MOCK_ERROR_RATE = float(os.getenv("WEATHER_MOCK_ERROR_RATE", "0"))  # share answered 5xx
+    MOCK_THROTTLE_RATE = float(os.getenv("WEATHER_MOCK_429_RATE", "0"))  # share answered 429
+    MOCK_RETRY_AFTER = float(os.getenv("WEATHER_MOCK_RETRY_AFTER", "1"))
+
+    API_UNITS = "metric"  # units requested from the API, converted client-side
+    TIMEOUT = 10
+
+    HTTP2 = os.getenv("OPENWEATHER_HTTP2", "1") != "0"
+    MAX_CONNECTIONS = int(os.getenv("OPENWEATHER_MAX_CONNECTIONS", "10"))
+    MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("OPENWEATHER_MAX_KEEPALIVE", "5"))
+    KEEPALIVE_EXPIRY = 30.0
+
+    # client-side limiter sized for the free plan (60 calls/minute)
+    RATE_LIMIT_PER_MINUTE = float(os.getenv("OPENWEATHER_RATE_LIMIT", "60"))
+    RATE_LIMIT_BURST = 10
+    MAX_RETRIES = 3
+    RETRY_BACKOFF = 0.5  # seconds, doubled on every attempt
+    RETRY_MAX_DELAY = 30.0  # longer Retry-After values fail instead of waiting
+
+    # Timing spans and counters (telemetry.py) are always kept in memory;
+    # set WEATHER_TELEMETRY to a file to export them every
+    # TELEMETRY_INTERVAL seconds: Prometheus text format for a *.prom path
+    # (e.g. for node_exporter's textfile collector), JSON lines otherwise.
+    TELEMETRY_FILE = os.getenv("WEATHER_TELEMETRY", "")
+    TELEMETRY_INTERVAL = float(os.getenv("WEATHER_TELEMETRY_INTERVAL", "10"))
+
+    CACHE_SIZE = 128
+    CURRENT_TTL = 600  # seconds; current conditions update about every 10 min
+    FORECAST_TTL = 1800  # the 3-hour forecast changes far less often
+    CACHE_DB = "weather_cache.db"  # relative to the working directory; "" disables it
+
+    @classmethod
+    def validate(cls):
+        if not cls.API_KEY or cls.API_KEY == "your_api_key_here":
+            raise ValueError(
+                "OPENWEATHER_API_KEY not found or default value used. "
+                "Please check your .env file."
+            )
+        return True
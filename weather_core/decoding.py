@@ -0,0 +1,145 @@
+import json
+from sys import intern
+from typing import Any, List, Optional, Union
+
+from .models import CurrentConditions, Forecast, ForecastSlot
+
+# JSON decoding for API payloads, using the fastest backend installed:
+# msgspec decodes straight into typed structs that only declare the fields
+# the app renders (everything else is skipped while parsing), orjson is a
+# faster drop-in for json.loads, and the stdlib is the fallback.
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+Raw = Union[bytes, str]
+
+if msgspec is not None:
+    BACKEND = "msgspec"
+elif orjson is not None:
+    BACKEND = "orjson"
+else:
+    BACKEND = "json"
+
+
+def loads(raw: Raw) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    if msgspec is not None:
+        return msgspec.json.decode(raw)
+    return json.loads(raw)
+
+
+if msgspec is not None:
+
+    class _Main(msgspec.Struct):
+        temp: float = 0.0
+        feels_like: float = 0.0
+        humidity: int = 0
+        temp_min: Optional[float] = None
+        temp_max: Optional[float] = None
+
+    class _Condition(msgspec.Struct):
+        id: int = 800
+        icon: str = "01d"
+        description: str = ""
+
+    class _Wind(msgspec.Struct):
+        speed: float = 0.0
+
+    class _Sys(msgspec.Struct):
+        country: str = ""
+
+    class _Current(msgspec.Struct):
+        name: str = "Unknown"
+        main: _Main = msgspec.field(default_factory=_Main)
+        weather: List[_Condition] = msgspec.field(default_factory=list)
+        wind: _Wind = msgspec.field(default_factory=_Wind)
+        sys: _Sys = msgspec.field(default_factory=_Sys)
+        dt: int = 0
+        timezone: int = 0
+
+    class _Precipitation(msgspec.Struct, rename={"three_hours": "3h"}):
+        three_hours: float = 0.0
+
+    class _Slot(msgspec.Struct):
+        dt: int
+        main: _Main
+        weather: List[_Condition] = msgspec.field(default_factory=list)
+        rain: Optional[_Precipitation] = None
+        snow: Optional[_Precipitation] = None
+        pop: float = 0.0
+
+    class _City(msgspec.Struct):
+        name: str = "Unknown"
+        country: str = ""
+        timezone: int = 0
+
+    class _Forecast(msgspec.Struct):
+        city: _City = msgspec.field(default_factory=_City)
+        list: List[_Slot] = msgspec.field(default_factory=list)
+
+    _current_decoder = msgspec.json.Decoder(_Current)
+    _forecast_decoder = msgspec.json.Decoder(_Forecast)
+    _NO_CONDITION = _Condition()
+
+    def decode_current(raw: Raw) -> CurrentConditions:
+        data = _current_decoder.decode(raw)
+        weather = data.weather[0] if data.weather else _NO_CONDITION
+        return CurrentConditions(
+            city=data.name,
+            country=data.sys.country,
+            temp=data.main.temp,
+            feels_like=data.main.feels_like,
+            humidity=data.main.humidity,
+            wind_speed=data.wind.speed,
+            condition_id=weather.id,
+            icon=weather.icon,
+            description=weather.description,
+            dt=data.dt,
+            timezone=data.timezone,
+        )
+
+    def _slot(item: "_Slot") -> ForecastSlot:
+        weather = item.weather[0] if item.weather else _NO_CONDITION
+        main = item.main
+        precipitation = 0.0
+        if item.rain is not None:
+            precipitation += item.rain.three_hours
+        if item.snow is not None:
+            precipitation += item.snow.three_hours
+        return ForecastSlot(
+            dt=item.dt,
+            temp=main.temp,
+            temp_min=main.temp if main.temp_min is None else main.temp_min,
+            temp_max=main.temp if main.temp_max is None else main.temp_max,
+            precipitation=precipitation,
+            pop=item.pop,
+            condition_id=weather.id,
+            icon=intern(weather.icon),
+            description=intern(weather.description),
+        )
+
+    def decode_forecast(raw: Raw) -> Forecast:
+        data = _forecast_decoder.decode(raw)
+        return Forecast(
+            city=data.city.name,
+            country=data.city.country,
+            timezone=data.city.timezone,
+            slots=tuple(_slot(item) for item in data.list),
+        )
+
+else:
+
+    def decode_current(raw: Raw) -> CurrentConditions:
+        return CurrentConditions.from_json(loads(raw))
+
+    def decode_forecast(raw: Raw) -> Forecast:
+        return Forecast.from_json(loads(raw))
@@ -0,0 +1,64 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS payloads (
+    endpoint TEXT NOT NULL,
+    city TEXT NOT NULL,
+    units TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (endpoint, city, units)
+)
+"""
+
+
+class DiskCache:
+    # Last known raw payload per (endpoint, city, units), kept across restarts
+    # so the UI has something to show before the network answers. Payloads
+    # are stored exactly as received and decoded by the caller. Calls are
+    # blocking; the service runs them in a worker thread.
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+        return self._conn
+
+    def get(self, key: Tuple[str, str, str]) -> Optional[Tuple[Union[bytes, str], float]]:
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT payload, fetched_at FROM payloads "
+                "WHERE endpoint = ? AND city = ? AND units = ?",
+                key,
+            ).fetchone()
+        if row is None:
+            return None
+        return row[0], row[1]
+
+    def put(self, key: Tuple[str, str, str], payload: Union[bytes, str], fetched_at: Optional[float] = None):
+        if fetched_at is None:
+            fetched_at = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO payloads (endpoint, city, units, fetched_at, payload) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (*key, fetched_at, payload),
+            )
+            conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,25 @@
+import os
+import tempfile
+from typing import Union
+
+
+def atomic_write(path: Union[str, os.PathLike], data: Union[bytes, str], fsync: bool = False):
+    # Write to a temp file in the same directory and rename it over `path`,
+    # so readers (and a crash) see either the old file or the new one, never
+    # a half-written one. fsync=True also flushes it to disk before the
+    # rename, for files that must survive a power cut.
+    path = os.fspath(path)
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path), suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
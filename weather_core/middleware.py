@@ -0,0 +1,271 @@
+import asyncio
+import random
+import sqlite3
+import time
+from typing import Awaitable, Callable, Dict, Optional, Sequence, Tuple
+
+from .cache import TTLCache
+from .disk_cache import DiskCache
+from .rate_limit import TokenBucket
+from .telemetry import Telemetry, telemetry as default_telemetry
+from .transport import Request, Response, Transport, TransportError
+
+# A request passes through each middleware in order before it reaches the
+# transport; every middleware gets the request and `call_next`, the rest of
+# the chain, and may answer itself, call on, retry or wrap the call.
+Handler = Callable[[Request], Awaitable[Response]]
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# transport errors worth another attempt; a replay miss will miss again
+RETRYABLE_ERRORS = {"timeout", "connect", "other"}
+
+
+class Middleware:
+
+    async def __call__(self, request: Request, call_next: Handler) -> Response:
+        return await call_next(request)
+
+    def stats(self) -> Dict:
+        return {}
+
+    async def aclose(self):
+        pass
+
+
+def build_chain(middleware: Sequence[Middleware], transport: Transport) -> Handler:
+    handler: Handler = transport.send
+    for layer in reversed(middleware):
+        handler = _bind(layer, handler)
+    return handler
+
+
+def _bind(layer: Middleware, call_next: Handler) -> Handler:
+    async def handle(request: Request) -> Response:
+        return await layer(request, call_next)
+
+    return handle
+
+
+class CacheMiddleware(Middleware):
+    # Memory cache of responses (parsed once, see Response.decode) in front
+    # of the on-disk copy of the raw payload, so the stored format does not
+    # depend on the model classes. Requests without a key pass straight
+    # through, and only 200 responses are kept. Concurrent requests for the
+    # same key share one load (single-flight); the shield keeps a cancelled
+    # caller from cancelling it for the rest.
+
+    def __init__(
+        self, memory: TTLCache, disk: Optional[DiskCache] = None, telemetry: Telemetry = default_telemetry
+    ):
+        self.memory = memory
+        self.disk = disk
+        self.telemetry = telemetry
+        self._inflight: Dict = {}
+
+    async def __call__(self, request: Request, call_next: Handler) -> Response:
+        if request.key is None:
+            return await call_next(request)
+        if not request.refresh:
+            response = self.memory.get(request.key)
+            if response is not None:
+                self.telemetry.incr("cache.hit.memory")
+                return response
+
+        task = self._inflight.get(request.key)
+        if task is not None:
+            self.telemetry.incr("cache.coalesced")
+        else:
+            task = asyncio.ensure_future(self._load(request, call_next))
+            self._inflight[request.key] = task
+            task.add_done_callback(lambda t: self._finish_flight(request.key, t))
+        return await asyncio.shield(task)
+
+    def _finish_flight(self, key, task: asyncio.Future):
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()  # mark retrieved even if every waiter went away
+
+    async def _load(self, request: Request, call_next: Handler) -> Response:
+        stored = None if request.refresh else await self.stored(request.key)
+        if stored is not None:
+            raw, fetched_at = stored
+            remaining = request.ttl - (time.time() - fetched_at)
+            if remaining > 0:
+                response = Response(200, raw, source="disk", fetched_at=fetched_at)
+                self.memory.set(request.key, response, remaining)
+                self.telemetry.incr("cache.hit.disk")
+                return response
+
+        self.telemetry.incr("cache.miss")
+        response = await call_next(request)
+        if response.status == 200:
+            self.memory.set(request.key, response, request.ttl)
+            await self._write_disk(request.key, response.content)
+        return response
+
+    def peek(self, key) -> Optional[Response]:
+        return self.memory.peek(key)
+
+    def remaining(self, key) -> Optional[float]:
+        return self.memory.remaining(key)
+
+    def evict(self, key):
+        # drop an entry the caller could not use (e.g. it failed to parse)
+        self.memory.pop(key)
+
+    async def stored(self, key) -> Optional[Tuple[bytes, float]]:
+        # the raw payload on disk and when it was fetched, regardless of age
+        if self.disk is None:
+            return None
+        try:
+            return await asyncio.to_thread(self.disk.get, key)
+        except sqlite3.Error:
+            return None
+
+    async def _write_disk(self, key, raw: bytes):
+        if self.disk is None:
+            return
+        try:
+            await asyncio.to_thread(self.disk.put, key, raw)
+        except sqlite3.Error:
+            pass  # the on-disk copy is only a startup accelerator
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    def stats(self) -> Dict:
+        return self.memory.stats()
+
+    async def aclose(self):
+        if self.disk is not None:
+            self.disk.close()
+
+
+class RetryMiddleware(Middleware):
+    # Retries transient transport errors and retryable statuses with
+    # exponential backoff and full jitter, or after the server's Retry-After.
+    # A Retry-After longer than max_delay is returned to the caller instead.
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_delay: float = 30.0,
+        telemetry: Telemetry = default_telemetry,
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.telemetry = telemetry
+        self.retries = 0
+
+    async def __call__(self, request: Request, call_next: Handler) -> Response:
+        attempt = 0
+        while True:
+            try:
+                response = await call_next(request)
+            except TransportError as e:
+                if e.kind not in RETRYABLE_ERRORS or attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                if response.status not in RETRYABLE_STATUS or attempt >= self.max_retries:
+                    return response
+                delay = response.retry_after
+                if delay is None:
+                    delay = self._backoff(attempt)
+                elif delay > self.max_delay:
+                    return response
+
+            attempt += 1
+            self.retries += 1
+            self.telemetry.incr("retries")
+            if delay:
+                await asyncio.sleep(delay)
+
+    def _backoff(self, attempt: int) -> float:
+        ceiling = min(self.max_delay, self.backoff * 2 ** attempt)
+        return random.uniform(0, ceiling)
+
+    def stats(self) -> Dict:
+        return {"retries": self.retries}
+
+
+class RateLimitMiddleware(Middleware):
+    # Takes a token per attempt. A 429 empties the bucket for the
+    # Retry-After period, holding back every caller and not just the one
+    # that was refused. The hold is capped at max_delay: a longer
+    # Retry-After is returned as an error (see RetryMiddleware) and must not
+    # leave the next search waiting on the bucket instead.
+
+    def __init__(self, bucket: TokenBucket, telemetry: Telemetry = default_telemetry, max_delay: float = 30.0):
+        self.bucket = bucket
+        self.telemetry = telemetry
+        self.max_delay = max_delay
+
+    async def __call__(self, request: Request, call_next: Handler) -> Response:
+        delay = self.bucket.reserve()
+        if delay:
+            self.telemetry.record("ratelimit.wait", delay)
+            await asyncio.sleep(delay)
+        response = await call_next(request)
+        if response.status == 429:
+            self.bucket.penalize(min(response.retry_after or 0.0, self.max_delay))
+            self.telemetry.incr("ratelimit.penalties")
+        return response
+
+    def stats(self) -> Dict:
+        return self.bucket.stats()
+
+
+class MetricsMiddleware(Middleware):
+    # Calls that reached the transport: count, status codes, transport
+    # errors and latency, per endpoint. Each call is also an "http.request"
+    # telemetry span, with the connect/TLS/wait stages under it.
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter, telemetry: Telemetry = default_telemetry):
+        self._clock = clock
+        self.telemetry = telemetry
+        self.endpoints: Dict[str, Dict] = {}
+
+    def _entry(self, endpoint: str) -> Dict:
+        entry = self.endpoints.get(endpoint)
+        if entry is None:
+            entry = self.endpoints[endpoint] = {
+                "requests": 0, "errors": 0, "status": {}, "seconds": 0.0, "max_seconds": 0.0,
+            }
+        return entry
+
+    async def __call__(self, request: Request, call_next: Handler) -> Response:
+        entry = self._entry(request.endpoint)
+        entry["requests"] += 1
+        with self.telemetry.span("http.request", endpoint=request.endpoint) as attrs:
+            start = self._clock()
+            try:
+                response = await call_next(request)
+            except Exception:
+                entry["errors"] += 1
+                self.telemetry.incr("http.transport_errors")
+                raise
+            finally:
+                elapsed = self._clock() - start
+                entry["seconds"] += elapsed
+                entry["max_seconds"] = max(entry["max_seconds"], elapsed)
+            attrs["status"] = response.status
+        self.telemetry.incr(f"http.status.{response.status}")
+        status = entry["status"]
+        status[response.status] = status.get(response.status, 0) + 1
+        return response
+
+    def stats(self) -> Dict:
+        return {
+            endpoint: {
+                "requests": entry["requests"],
+                "errors": entry["errors"],
+                "status": dict(entry["status"]),
+                "mean_ms": round(entry["seconds"] / entry["requests"] * 1000, 2) if entry["requests"] else 0.0,
+                "max_ms": round(entry["max_seconds"] * 1000, 2),
+            }
+            for endpoint, entry in self.endpoints.items()
+        }
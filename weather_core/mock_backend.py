@@ -0,0 +1,140 @@
+import asyncio
+import json
+import random
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import httpx
+
+from .config import CoreConfig
+
+SCHEME = "mock://"
+SLOT = 3 * 3600  # the forecast's step, in seconds
+DAY = 24 * 3600
+TIMESTAMPS = ("dt", "sunrise", "sunset")
+
+
+def _shift(value, offset: int):
+    # move every unix timestamp in a payload by `offset` seconds, and the
+    # forecast's "dt_txt" along with its "dt"
+    if isinstance(value, list):
+        return [_shift(item, offset) for item in value]
+    if not isinstance(value, dict):
+        return value
+    shifted = {key: _shift(item, offset) for key, item in value.items()}
+    for key in TIMESTAMPS:
+        if isinstance(shifted.get(key), int):
+            shifted[key] += offset
+    if "dt_txt" in shifted and "dt" in shifted:
+        shifted["dt_txt"] = datetime.fromtimestamp(shifted["dt"], timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    return shifted
+
+
+class MockBackend:
+    # In-process stand-in for the OpenWeather endpoints, mounted for mock://
+    # URLs by transport.MockTransport. It serves the payloads in fixtures/
+    # (synthetic, not captured from the API; see fixtures/README.md) after a
+    # simulated network delay, with their timestamps moved by whole
+    # days so the forecast always lies ahead (the app skips days that have
+    # passed), and fails a configurable share of requests with a 5xx or
+    # a 429 + Retry-After so the retry and rate-limit paths get exercised
+    # without touching the API.
+
+    ROUTES = {"weather": "current.json", "forecast": "forecast.json"}
+
+    def __init__(
+        self,
+        fixtures,
+        latency: float = 0.05,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        seed: Optional[int] = None,
+    ):
+        self.fixtures = Path(fixtures)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self._rng = random.Random(seed)
+        self._fixtures: Dict[str, Dict] = {}
+        self._payloads: Dict[str, Tuple[int, bytes]] = {}  # name -> (offset, shifted payload)
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+
+    @classmethod
+    def from_config(cls, config=CoreConfig) -> "MockBackend":
+        return cls(
+            config.MOCK_FIXTURES,
+            latency=config.MOCK_LATENCY,
+            jitter=config.MOCK_JITTER,
+            error_rate=config.MOCK_ERROR_RATE,
+            throttle_rate=config.MOCK_THROTTLE_RATE,
+            retry_after=config.MOCK_RETRY_AFTER,
+        )
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def _payload(self, name: str, now: Optional[float] = None) -> bytes:
+        # Re-dated by whole days, so each slot keeps its hour of the day (the
+        # afternoon stays warmest): the current conditions land within the
+        # last 24 hours and the forecast follows them. Requests in between
+        # get the same bytes.
+        data = self._fixtures.get(name)
+        if data is None:
+            data = self._fixtures[name] = json.loads((self.fixtures / name).read_bytes())
+        # both files are anchored on the slot of the current conditions
+        anchor = data["list"][0]["dt"] - SLOT if "list" in data else data["dt"] // SLOT * SLOT
+        now = int(time.time() if now is None else now)
+        offset = (now - anchor) // DAY * DAY
+        cached = self._payloads.get(name)
+        if cached is None or cached[0] != offset:
+            cached = self._payloads[name] = (offset, json.dumps(_shift(data, offset)).encode())
+        return cached[1]
+
+    def _geocode(self, city: str) -> bytes:
+        # every name resolves, to the coordinates of the recorded city
+        coord = json.loads(self._payload("current.json")).get("coord", {})
+        return json.dumps([{
+            "name": city, "country": "",
+            "lat": coord.get("lat", 0.0), "lon": coord.get("lon", 0.0),
+        }]).encode()
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        delay = self.latency + self._rng.uniform(-self.jitter, self.jitter)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        roll = self._rng.random()
+        if roll < self.throttle_rate:
+            self.throttled += 1
+            return httpx.Response(
+                429,
+                headers={"Retry-After": f"{self.retry_after:g}"},
+                json={"cod": 429, "message": "rate limited (mock)"},
+            )
+        if roll < self.throttle_rate + self.error_rate:
+            self.errors += 1
+            return httpx.Response(self._rng.choice((500, 502, 503)), json={"cod": 500})
+
+        if not request.url.params.get("appid"):
+            return httpx.Response(401, json={"cod": 401, "message": "Invalid API key."})
+
+        endpoint = request.url.path.rstrip("/").rsplit("/", 1)[-1]
+        if endpoint == "direct":
+            return httpx.Response(200, content=self._geocode(request.url.params.get("q", "")))
+        name = self.ROUTES.get(endpoint)
+        if name is None:
+            # One Call is not recorded; the service falls back to "dual"
+            return httpx.Response(401, json={"cod": 401, "message": "not available in the mock"})
+        return httpx.Response(200, content=self._payload(name), headers={"Content-Type": "application/json"})
+
+    def stats(self) -> Dict[str, int]:
+        return {"requests": self.requests, "errors": self.errors, "throttled": self.throttled}
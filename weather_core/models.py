@@ -0,0 +1,126 @@
+from dataclasses import dataclass
+from sys import intern
+from datetime import date
+from typing import Dict, Tuple
+
+# Compact, slotted views of the API payloads. The service parses each
+# response once and everything downstream (caches, batch results, the UI)
+# holds these instead of the decoded JSON trees, keeping only the fields
+# the app renders. Icon codes and descriptions come from a small fixed set,
+# so they are interned instead of stored once per forecast slot.
+
+
+def _condition(item: Dict) -> Dict:
+    weather = item.get("weather") or [{}]
+    return weather[0]
+
+
+@dataclass
+class CurrentConditions:
+    __slots__ = (
+        "city", "country", "temp", "feels_like", "humidity", "wind_speed",
+        "condition_id", "icon", "description", "dt", "timezone",
+    )
+    city: str
+    country: str
+    temp: float
+    feels_like: float
+    humidity: int
+    wind_speed: float
+    condition_id: int
+    icon: str
+    description: str
+    dt: int
+    timezone: int
+
+    @classmethod
+    def from_json(cls, data: Dict) -> "CurrentConditions":
+        main = data.get("main", {})
+        weather = _condition(data)
+        return cls(
+            city=data.get("name", "Unknown"),
+            country=data.get("sys", {}).get("country", ""),
+            temp=main.get("temp", 0),
+            feels_like=main.get("feels_like", 0),
+            humidity=main.get("humidity", 0),
+            wind_speed=data.get("wind", {}).get("speed", 0),
+            condition_id=weather.get("id", 800),
+            icon=weather.get("icon", "01d"),
+            description=weather.get("description", ""),
+            dt=data.get("dt", 0),
+            timezone=data.get("timezone", 0),
+        )
+
+
+@dataclass
+class ForecastSlot:
+    __slots__ = (
+        "dt", "temp", "temp_min", "temp_max", "precipitation", "pop",
+        "condition_id", "icon", "description",
+    )
+    dt: int
+    temp: float
+    temp_min: float
+    temp_max: float
+    precipitation: float
+    pop: float
+    condition_id: int
+    icon: str
+    description: str
+
+    @classmethod
+    def from_json(cls, item: Dict) -> "ForecastSlot":
+        main = item["main"]
+        weather = _condition(item)
+        rain = item.get("rain") or {}
+        snow = item.get("snow") or {}
+        return cls(
+            dt=item["dt"],
+            temp=main["temp"],
+            temp_min=main.get("temp_min", main["temp"]),
+            temp_max=main.get("temp_max", main["temp"]),
+            precipitation=rain.get("3h", 0.0) + snow.get("3h", 0.0),
+            pop=item.get("pop", 0.0),
+            condition_id=weather.get("id", 800),
+            icon=intern(weather.get("icon", "01d")),
+            description=intern(weather.get("description", "")),
+        )
+
+
+@dataclass
+class Forecast:
+    __slots__ = ("city", "country", "timezone", "slots")
+    city: str
+    country: str
+    timezone: int
+    slots: Tuple[ForecastSlot, ...]
+
+    @classmethod
+    def from_json(cls, data: Dict) -> "Forecast":
+        city = data.get("city", {})
+        return cls(
+            city=city.get("name", "Unknown"),
+            country=city.get("country", ""),
+            timezone=city.get("timezone", 0),
+            slots=tuple(ForecastSlot.from_json(item) for item in data.get("list", [])),
+        )
+
+
+@dataclass
+class DailySummary:
+    __slots__ = (
+        "date", "day", "temp", "icon", "description", "temp_min", "temp_max",
+        "temp_mean", "precipitation", "pop", "condition_id", "condition",
+    )
+    date: date
+    day: str
+    temp: float  # the slot closest to local noon
+    icon: str
+    description: str
+    temp_min: float
+    temp_max: float
+    temp_mean: float
+    precipitation: float
+    pop: float
+    condition_id: int  # most frequent condition over the day
+    condition: str
@@ -0,0 +1,61 @@
+from datetime import datetime, timezone
+from typing import Dict, Tuple
+
+# One Call returns current conditions and the daily outlook for a coordinate
+# in one response. The UI renders the /weather and /forecast shapes, so the
+# One Call payload is reshaped into those instead of teaching every renderer
+# a second format.
+
+
+def _dt_txt(timestamp: int) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def split_onecall(data: Dict, location: Dict) -> Tuple[Dict, Dict]:
+    offset = data.get("timezone_offset", 0)
+    now = data.get("current", {})
+
+    current = {
+        "name": location.get("name", "Unknown"),
+        "coord": {"lat": location.get("lat"), "lon": location.get("lon")},
+        "sys": {"country": location.get("country", "")},
+        "dt": now.get("dt"),
+        "timezone": offset,
+        "main": {
+            "temp": now.get("temp", 0),
+            "feels_like": now.get("feels_like", 0),
+            "humidity": now.get("humidity", 0),
+            "pressure": now.get("pressure"),
+        },
+        "wind": {"speed": now.get("wind_speed", 0)},
+        "weather": now.get("weather", [{}]),
+    }
+
+    forecast_list = []
+    for day in data.get("daily", []):
+        temps = day.get("temp", {})
+        forecast_list.append({
+            "dt": day["dt"],
+            "dt_txt": _dt_txt(day["dt"]),
+            "main": {
+                "temp": temps.get("day", 0),
+                "temp_min": temps.get("min", temps.get("day", 0)),
+                "temp_max": temps.get("max", temps.get("day", 0)),
+                "humidity": day.get("humidity", 0),
+            },
+            "weather": day.get("weather", [{}]),
+            "pop": day.get("pop", 0),
+            "rain": {"3h": day.get("rain", 0)},
+            "snow": {"3h": day.get("snow", 0)},
+        })
+
+    forecast = {
+        "city": {
+            "name": current["name"],
+            "country": current["sys"]["country"],
+            "timezone": offset,
+            "coord": current["coord"],
+        },
+        "list": forecast_list,
+    }
+    return current, forecast
@@ -0,0 +1,68 @@
+import asyncio
+import time
+from typing import Callable, Dict
+
+
+class TokenBucket:
+    # Client-side limiter: `rate` tokens per second, bursts up to `capacity`.
+    # Tokens are reserved synchronously (the balance may go negative) and the
+    # caller sleeps off its share of the deficit, so waiters are served in
+    # arrival order without a lock.
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self.acquired = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.penalties = 0
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        # Take tokens now and return how long the caller has to wait for them.
+        self._refill()
+        self._tokens -= tokens
+        self.acquired += 1
+        if self._tokens >= 0:
+            return 0.0
+        delay = -self._tokens / self.rate
+        self.throttled += 1
+        self.total_wait += delay
+        return delay
+
+    async def acquire(self, tokens: float = 1.0):
+        delay = self.reserve(tokens)
+        if delay:
+            await asyncio.sleep(delay)
+
+    def penalize(self, seconds: float):
+        # The server told us to back off (429 + Retry-After): empty the bucket
+        # so that the next token only becomes available after `seconds`.
+        self._refill()
+        self._tokens = min(self._tokens, 1.0 - seconds * self.rate)
+        self.penalties += 1
+
+    @property
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "rate_per_second": self.rate,
+            "capacity": self.capacity,
+            "available": round(self.available, 3),
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "total_wait_seconds": round(self.total_wait, 3),
+            "penalties": self.penalties,
+        }
@@ -0,0 +1,340 @@
+import asyncio
+import time
+from dataclasses import replace
+from typing import Any, AsyncIterable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .batch import BatchRun, CityResult
+from .cache import TTLCache
+from .config import CoreConfig
+from .decoding import Raw, decode_current, decode_forecast, loads
+from .disk_cache import DiskCache
+from .middleware import (
+    CacheMiddleware, MetricsMiddleware, Middleware, RateLimitMiddleware, RetryMiddleware, build_chain,
+)
+from .models import CurrentConditions, Forecast
+from .onecall import split_onecall
+from .rate_limit import TokenBucket
+from .telemetry import Telemetry, telemetry as default_telemetry
+from .transport import Request, Transport, TransportError, transport_from_config
+
+
+class WeatherServiceError(Exception):
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+GEOCODE_TTL = float("inf")  # coordinates of a place never go stale
+
+
+class WeatherService:
+    # The one service both apps use. Every API call is a Request sent down
+    # a middleware chain (cache -> retry -> rate limit -> metrics) to a
+    # transport (live HTTP, the mock backend, or recorded replays); this
+    # class only builds requests and turns responses into models or
+    # WeatherServiceError.
+
+    def __init__(
+        self,
+        config=CoreConfig,
+        transport: Optional[Transport] = None,
+        telemetry: Telemetry = default_telemetry,
+    ):
+        self.config = config
+        self.telemetry = telemetry
+        self.api_key = config.API_KEY
+        self.base_url = config.BASE_URL
+        self.forecast_url = config.FORECAST_URL
+        self.geocode_url = config.GEOCODE_URL
+        self.onecall_url = config.ONECALL_URL
+        self.onecall_enabled = config.FETCH_MODE == "onecall"
+        self.transport = transport if transport is not None else transport_from_config(config, telemetry)
+        self.mock_backend = getattr(self.transport, "backend", None)
+
+        self.cache = TTLCache(config.CACHE_SIZE)
+        # an empty CACHE_DB turns the on-disk copy off (e.g. one-shot CLI runs)
+        self.disk_cache = DiskCache(config.CACHE_DB) if config.CACHE_DB else None
+        self.rate_limiter = TokenBucket(
+            config.RATE_LIMIT_PER_MINUTE / 60, config.RATE_LIMIT_BURST
+        )
+        self.caching = CacheMiddleware(self.cache, self.disk_cache, telemetry=telemetry)
+        self.retry = RetryMiddleware(
+            config.MAX_RETRIES, config.RETRY_BACKOFF, config.RETRY_MAX_DELAY, telemetry=telemetry
+        )
+        self.metrics = MetricsMiddleware(telemetry=telemetry)
+        self.middleware: List[Middleware] = [
+            self.caching,
+            self.retry,
+            RateLimitMiddleware(self.rate_limiter, telemetry, config.RETRY_MAX_DELAY),
+            self.metrics,
+        ]
+        self._send = build_chain(self.middleware, self.transport)
+        self.errors = 0
+
+    def use(self, middleware: Middleware, index: int = 0):
+        # add a middleware, outermost by default (it then sees cache hits too)
+        self.middleware.insert(index, middleware)
+        self._send = build_chain(self.middleware, self.transport)
+
+    @property
+    def retries(self) -> int:
+        return self.retry.retries
+
+    async def aclose(self):
+        await self.transport.aclose()
+        for layer in self.middleware:
+            await layer.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def _request(
+        self,
+        endpoint: str,
+        url: str,
+        city: str,
+        parse: Callable[[Raw], Any],
+        params: Optional[Dict] = None,
+        key=None,
+        ttl: float = 0.0,
+        refresh: bool = False,
+    ):
+        if not city.strip():
+            raise WeatherServiceError("City name cannot be empty")
+        if params is None:
+            params = {"q": city.strip(), "units": self.config.API_UNITS}
+        params["appid"] = self.api_key
+        with self.telemetry.span(f"service.{endpoint}"):
+            return await self._send_and_parse(Request(endpoint, url, params, key, ttl, refresh), city, parse)
+
+    def _failed(self, error: WeatherServiceError) -> WeatherServiceError:
+        self.errors += 1
+        self.telemetry.incr("errors")
+        if error.status_code is not None:
+            self.telemetry.incr(f"errors.{error.status_code}")
+        return error
+
+    async def _send_and_parse(self, request: Request, city: str, parse: Callable[[Raw], Any]):
+        try:
+            response = await self._send(request)
+        except TransportError as e:
+            raise self._failed(self._transport_error(e))
+        except Exception as e:
+            raise self._failed(WeatherServiceError(f"An unexpected error occurred: {e}"))
+
+        if response.status != 200:
+            raise self._failed(self._status_error(response.status, city.strip()))
+        try:
+            if response.decoded:
+                return response.decode(parse)
+            with self.telemetry.span(f"decode.{request.endpoint}"):
+                return response.decode(parse)
+        except Exception as e:
+            if request.key is not None:
+                self.caching.evict(request.key)
+            if response.source == "disk":
+                # unreadable stored entry; fetch a fresh one
+                return await self._send_and_parse(replace(request, refresh=True), city, parse)
+            if isinstance(e, WeatherServiceError):
+                self._failed(e)
+                raise
+            raise self._failed(WeatherServiceError(f"An unexpected error occurred: {e}"))
+
+    @staticmethod
+    def _status_error(status_code: int, city: str) -> WeatherServiceError:
+        if status_code == 404:
+            message = f"City '{city}' not found. Please check the spelling."
+        elif status_code == 401:
+            message = "Invalid API key. Please check your configuration."
+        elif status_code == 429:
+            message = "Too many requests. Please wait a moment and try again."
+        else:
+            message = f"Error fetching data: {status_code}"
+        return WeatherServiceError(message, status_code)
+
+    @staticmethod
+    def _transport_error(e: TransportError) -> WeatherServiceError:
+        if e.kind == "timeout":
+            return WeatherServiceError(
+                "Request timed out. Check your internet connection."
+            )
+        elif e.kind == "connect":
+            return WeatherServiceError(
+                "Could not connect to the weather service API."
+            )
+        elif e.kind == "replay":
+            return WeatherServiceError(str(e))
+        return WeatherServiceError(f"An unexpected error occurred: {e}")
+
+    def stats(self) -> Dict:
+        return {
+            "cache": self.cache.stats(),
+            "rate_limiter": self.rate_limiter.stats(),
+            "retries": self.retries,
+            "errors": self.errors,
+            "in_flight": self.caching.in_flight,
+            "requests": self.metrics.stats(),
+            "transport": self.transport.stats(),
+        }
+
+    @staticmethod
+    def _cache_key(endpoint: str, city: str, units: str):
+        return endpoint, " ".join(city.split()).casefold(), units
+
+    async def get_stale(self, city: str) -> Optional[Tuple[CurrentConditions, Forecast, float]]:
+        # Last stored current + forecast for a city regardless of age, for
+        # stale-while-revalidate rendering at startup.
+        try:
+            current = await self.caching.stored(self._cache_key("weather", city, self.config.API_UNITS))
+            forecast = await self.caching.stored(self._cache_key("forecast", city, self.config.API_UNITS))
+            if current is not None and forecast is not None:
+                return (
+                    decode_current(current[0]),
+                    decode_forecast(forecast[0]),
+                    min(current[1], forecast[1]),
+                )
+
+            stored_location = await self.caching.stored(self._cache_key("geocode", city, ""))
+            if stored_location is not None:
+                location = self._parse_location(stored_location[0], city)
+                onecall = await self.caching.stored(self._onecall_key(location))
+                if onecall is not None:
+                    return (*self._parse_onecall(loads(onecall[0]), location), onecall[1])
+        except Exception:
+            pass  # an unreadable entry just means there is nothing to show early
+        return None
+
+    async def get_current_weather(self, city: str, refresh: bool = False) -> CurrentConditions:
+        key = self._cache_key("weather", city, self.config.API_UNITS)
+        return await self._request(
+            "weather", self.base_url, city, decode_current,
+            key=key, ttl=self.config.CURRENT_TTL, refresh=refresh,
+        )
+
+    async def get_5day_forecast(self, city: str, refresh: bool = False) -> Forecast:
+        key = self._cache_key("forecast", city, self.config.API_UNITS)
+        return await self._request(
+            "forecast", self.forecast_url, city, decode_forecast,
+            key=key, ttl=self.config.FORECAST_TTL, refresh=refresh,
+        )
+
+    def _parse_location(self, raw: Raw, city: str) -> Dict:
+        matches = loads(raw)
+        if not matches:
+            raise WeatherServiceError(
+                f"City '{city.strip()}' not found. Please check the spelling.", 404
+            )
+        match = matches[0]
+        return {
+            "name": match.get("name", city.strip()),
+            "country": match.get("country", ""),
+            "lat": match["lat"],
+            "lon": match["lon"],
+        }
+
+    async def geocode(self, city: str) -> Dict:
+        # Resolve a city name to {name, country, lat, lon} once; the result
+        # is kept in memory and on disk with no expiry.
+        return await self._request(
+            "geocode", self.geocode_url, city, lambda raw: self._parse_location(raw, city),
+            params={"q": city.strip(), "limit": 1},
+            key=self._cache_key("geocode", city, ""), ttl=GEOCODE_TTL,
+        )
+
+    def _onecall_key(self, location: Dict):
+        return "onecall", f"{location['lat']:.4f},{location['lon']:.4f}", self.config.API_UNITS
+
+    @staticmethod
+    def _parse_onecall(data: Dict, location: Dict) -> Tuple[CurrentConditions, Forecast]:
+        current, forecast = split_onecall(data, location)
+        return CurrentConditions.from_json(current), Forecast.from_json(forecast)
+
+    async def _get_onecall(self, city: str, refresh: bool = False) -> Tuple[CurrentConditions, Forecast]:
+        location = await self.geocode(city)
+        params = {
+            "lat": location["lat"],
+            "lon": location["lon"],
+            "units": self.config.API_UNITS,
+            "exclude": "minutely,hourly,alerts",
+        }
+        return await self._request(
+            "onecall", self.onecall_url, city, lambda raw: self._parse_onecall(loads(raw), location),
+            params=params, key=self._onecall_key(location), ttl=self.config.CURRENT_TTL, refresh=refresh,
+        )
+
+    def _bundle_keys(self, city: str) -> Optional[List]:
+        # cache keys holding a city's bundle in the current mode; None when
+        # One Call cannot tell without geocoding first
+        if not self.onecall_enabled:
+            return [
+                self._cache_key("weather", city, self.config.API_UNITS),
+                self._cache_key("forecast", city, self.config.API_UNITS),
+            ]
+        location = self.caching.peek(self._cache_key("geocode", city, ""))
+        if location is None or location.data is None:
+            return None
+        return [self._onecall_key(location.data)]
+
+    def cached_bundle(self, city: str) -> Optional[Tuple[CurrentConditions, Forecast]]:
+        # The bundle for a city if it is fresh in memory; never waits.
+        keys = self._bundle_keys(city)
+        if keys is None:
+            return None
+        responses = [self.caching.peek(key) for key in keys]
+        if any(response is None or response.data is None for response in responses):
+            return None
+        values = [response.data for response in responses]
+        return values[0] if len(values) == 1 else tuple(values)
+
+    def expires_in(self, city: str) -> Optional[float]:
+        # Seconds until the first part of a city's cached bundle expires, or
+        # None if it is not in the memory cache.
+        keys = self._bundle_keys(city)
+        if keys is None:
+            return None
+        remaining = [self.caching.remaining(key) for key in keys]
+        if any(left is None for left in remaining):
+            return None
+        return min(remaining)
+
+    async def get_weather_bundle(self, city: str, refresh: bool = False) -> Tuple[CurrentConditions, Forecast]:
+        # Current conditions and forecast for a city, using one coordinate
+        # request in "onecall" mode and the two city-name endpoints otherwise.
+        if self.onecall_enabled:
+            try:
+                return await self._get_onecall(city, refresh)
+            except WeatherServiceError as e:
+                if e.status_code not in (401, 403):
+                    raise
+                self.onecall_enabled = False  # key has no One Call access
+        current, forecast = await asyncio.gather(
+            self.get_current_weather(city, refresh), self.get_5day_forecast(city, refresh)
+        )
+        return current, forecast
+
+    async def _fetch_city(self, city: str, forecast: bool) -> CityResult:
+        start = time.perf_counter()
+        result = CityResult(city)
+        try:
+            if forecast:
+                result.current, result.forecast = await self.get_weather_bundle(city)
+            else:
+                result.current = await self.get_current_weather(city)
+        except WeatherServiceError as e:
+            result.error = str(e)
+        except Exception as e:
+            result.error = f"An unexpected error occurred: {e}"
+        result.elapsed = time.perf_counter() - start
+        return result
+
+    def get_many(
+        self, cities: Union[Iterable[str], AsyncIterable[str]], concurrency: int = 10, forecast: bool = True
+    ) -> BatchRun:
+        # async for result in service.get_many(cities): ...
+        # Failures are reported per city on the result instead of aborting the
+        # batch; run.summary holds counts and throughput afterwards.
+        return BatchRun(lambda city: self._fetch_city(city, forecast), cities, concurrency)
@@ -0,0 +1,92 @@
+import sys
+import time
+from typing import List, Optional, TextIO, Tuple
+
+FLAG = "--profile-startup"
+
+
+class StartupProfile:
+    # Wall-clock marks from the top of main.py to the first frame, printed to
+    # stderr when the app is started with --profile-startup. Disabled
+    # profiles still take marks (they are just a perf_counter call) but
+    # never print or spawn anything. `cwd` is the app's directory, where its
+    # main module is imported from for the import breakdown.
+
+    def __init__(
+        self,
+        started: float,
+        enabled: Optional[bool] = None,
+        out: TextIO = sys.stderr,
+        cwd: Optional[str] = None,
+    ):
+        self.enabled = FLAG in sys.argv if enabled is None else enabled
+        self.started = started
+        self.out = out
+        self.cwd = cwd
+        self.marks: List[Tuple[str, float]] = []
+        self.reported = False
+
+    def mark(self, label: str, once: bool = False):
+        if once and any(existing == label for existing, _ in self.marks):
+            return
+        now = time.perf_counter()
+        self.marks.append((label, now))
+        if self.enabled and self.reported:
+            # late marks (first weather, first search) print as they happen
+            self.out.write(f"[startup] {label:<28} {(now - self.started) * 1000:8.1f} ms\n")
+            self.out.flush()
+
+    def report(self, module: str = "main", top: int = 12):
+        if not self.enabled or self.reported:
+            return
+        self.reported = True
+        lines = ["[startup] phase                        total ms   step ms"]
+        previous = self.started
+        for label, at in self.marks:
+            lines.append(f"[startup] {label:<28} {(at - self.started) * 1000:8.1f} {(at - previous) * 1000:9.1f}")
+            previous = at
+        lines.append(f"[startup] slowest imports of '{module}' (cold, fresh interpreter):")
+        for cumulative, own, name in import_breakdown(module, self.cwd)[:top]:
+            lines.append(f"[startup]   {cumulative / 1000:8.1f} ms  (self {own / 1000:6.1f})  {name}")
+        self.out.write("\n".join(lines) + "\n")
+        self.out.flush()
+
+
+def import_breakdown(module: str, cwd: Optional[str] = None) -> List[Tuple[int, int, str]]:
+    # (cumulative us, self us, name) for the top-level imports of `module`,
+    # slowest first, from `python -X importtime` in a child process so the
+    # numbers are not skewed by what this process already loaded
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return []
+    # children are printed before their parent, so collect the direct
+    # imports and keep them once the module's own line shows up; anything
+    # the interpreter imported at startup (site, encodings, ...) is dropped
+    rows: List[Tuple[int, int, str]] = []
+    pending: List[Tuple[int, int, str]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        if not own.strip().isdigit():
+            continue  # header line
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        row = (int(cumulative), int(own), name.strip())
+        if depth == 1:
+            pending.append(row)
+        elif depth == 0:
+            if row[2] == module:
+                rows.extend(pending)
+                rows.append(row)
+            pending = []
+    rows.sort(reverse=True)
+    return rows
@@ -0,0 +1,213 @@
+import asyncio
+import contextvars
+import itertools
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Iterator, List, Optional
+
+from .files import atomic_write
+
+# Timing spans and counters for the request path, kept in memory for the
+# diagnostics panel and optionally exported to a local file. A span is a
+# named, timed stage ("search", "http.connect", "decode.forecast", ...);
+# spans opened while another is running (also in tasks started from it)
+# share its trace id, so one search can be followed end to end in the
+# JSON lines export.
+
+QUANTILES = (0.5, 0.95, 0.99)
+MAX_PENDING = 1000  # JSON lines held before they are written out regardless of the interval
+
+_trace_id = itertools.count(1)
+_current: contextvars.ContextVar = contextvars.ContextVar("weather_span", default=None)
+
+
+class _Series:
+    # The last `window` durations of one span, plus running totals.
+
+    __slots__ = ("recent", "count", "total", "max")
+
+    def __init__(self, window: int):
+        self.recent: Deque[float] = deque(maxlen=window)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float):
+        self.recent.append(seconds)
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def quantile(self, q: float, ordered: Optional[List[float]] = None) -> float:
+        ordered = ordered if ordered is not None else sorted(self.recent)
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class Telemetry:
+
+    def __init__(self, window: int = 512, clock: Callable[[], float] = time.perf_counter):
+        self.window = window
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()  # one flush writes the file at a time
+        self._series: Dict[str, _Series] = {}
+        self._counters: Dict[str, float] = {}
+        self._pending: List[str] = []  # JSON lines not written yet, at most MAX_PENDING
+        self._flush_queued = False
+        self.path: Optional[str] = None
+        self.format = "jsonl"
+        self.interval = 10.0
+
+    def configure(self, path: Optional[str], interval: float = 10.0):
+        # Export to `path`: Prometheus text format (rewritten on every flush)
+        # if it ends in .prom, otherwise one JSON line per finished span.
+        self.path = path or None
+        self.format = "prometheus" if path and path.endswith(".prom") else "jsonl"
+        self.interval = interval
+        return self
+
+    @property
+    def exporting(self) -> bool:
+        return self.path is not None
+
+    @contextmanager
+    def span(self, name: str, **attrs) -> Iterator[Dict]:
+        # with telemetry.span("fetch", city=city) as attrs: ...
+        # attrs can be filled in inside the block; it is exported with the span
+        parent = _current.get()
+        trace = parent[0] if parent is not None else next(_trace_id)
+        token = _current.set((trace, name))
+        start = self._clock()
+        try:
+            yield attrs
+        except BaseException as e:
+            attrs["error"] = type(e).__name__
+            raise
+        finally:
+            _current.reset(token)
+            self.record(name, self._clock() - start, attrs, trace, parent[1] if parent else None)
+
+    def record(
+        self,
+        name: str,
+        seconds: float,
+        attrs: Optional[Dict] = None,
+        trace: Optional[int] = None,
+        parent: Optional[str] = None,
+    ):
+        # a finished span measured elsewhere (e.g. from httpx trace events)
+        if trace is None:
+            current = _current.get()
+            trace, parent = (current[0], current[1]) if current else (next(_trace_id), None)
+        full = False
+        with self._lock:
+            series = self._series.get(name)
+            if series is None:
+                series = self._series[name] = _Series(self.window)
+            series.add(seconds)
+            if self.path is not None and self.format == "jsonl":
+                line = {"ts": round(time.time(), 3), "trace": trace, "span": name,
+                        "parent": parent, "ms": round(seconds * 1000, 3)}
+                if attrs:
+                    line.update(attrs)
+                self._pending.append(json.dumps(line, default=str))
+                full = len(self._pending) >= MAX_PENDING and not self._flush_queued
+                if full:
+                    self._flush_queued = True
+        if full:
+            # keeps memory flat when spans arrive faster than the exporter
+            # runs; the write itself goes to a worker thread if this is the loop
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self.flush()
+            else:
+                loop.run_in_executor(None, self.flush)
+
+    def incr(self, name: str, value: float = 1):
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def counters(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._counters)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        # per span: count, mean/max over the whole run and p50/p95/p99 over
+        # the last `window` samples, in milliseconds
+        with self._lock:
+            series = {name: (s, sorted(s.recent)) for name, s in self._series.items()}
+        return {
+            name: {
+                "count": s.count,
+                "mean_ms": s.total / s.count * 1000 if s.count else 0.0,
+                "max_ms": s.max * 1000,
+                **{f"p{round(q * 100)}_ms": s.quantile(q, ordered) * 1000 for q in QUANTILES},
+            }
+            for name, (s, ordered) in series.items()
+        }
+
+    def prometheus(self) -> str:
+        lines = [
+            "# HELP weather_span_seconds Duration of each stage of the weather request path.",
+            "# TYPE weather_span_seconds summary",
+        ]
+        with self._lock:
+            series = {name: (s, sorted(s.recent)) for name, s in self._series.items()}
+            counters = dict(self._counters)
+        for name, (s, ordered) in sorted(series.items()):
+            for q in QUANTILES:
+                lines.append(f'weather_span_seconds{{span="{name}",quantile="{q}"}} {s.quantile(q, ordered):.6f}')
+            lines.append(f'weather_span_seconds_sum{{span="{name}"}} {s.total:.6f}')
+            lines.append(f'weather_span_seconds_count{{span="{name}"}} {s.count}')
+        lines.append("# HELP weather_events_total Cache hits, retries, errors and other events.")
+        lines.append("# TYPE weather_events_total counter")
+        for name, value in sorted(counters.items()):
+            lines.append(f'weather_events_total{{event="{name}"}} {_number(value)}')
+        return "\n".join(lines) + "\n"
+
+    def flush(self):
+        # write out what has been collected; blocking, run it off the loop
+        if self.path is None:
+            return
+        with self._write_lock:
+            if self.format == "prometheus":
+                atomic_write(self.path, self.prometheus())  # scrapers never see a half-written file
+                return
+            with self._lock:
+                pending, self._pending = self._pending, []
+                self._flush_queued = False
+            if pending:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write("\n".join(pending) + "\n")
+
+    async def run_exporter(self):
+        # flush every `interval` seconds until cancelled, then once more
+        try:
+            while True:
+                await asyncio.sleep(self.interval)
+                await asyncio.to_thread(self.flush)
+        finally:
+            self.flush()
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+            self._counters.clear()
+            self._pending.clear()
+            self._flush_queued = False
+
+
+def _number(value: float) -> str:
+    # exact, unlike :g (12345678 -> 1.23457e+07)
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+# one per process, shared by the service core and the app
+telemetry = Telemetry()
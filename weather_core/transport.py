@@ -0,0 +1,302 @@
+import asyncio
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional
+
+import httpx
+
+from .config import CoreConfig
+from .files import atomic_write
+from .telemetry import Telemetry
+
+_UNSET = object()
+
+# httpcore trace events (minus their "connection."/"http11."/"http2." prefix)
+# timed as telemetry spans. DNS resolution happens inside connect_tcp.
+TRACE_STAGES = {
+    "connect_tcp": "http.connect",
+    "start_tls": "http.tls",
+    "receive_response_headers": "http.wait",
+    "receive_response_body": "http.body",
+}
+
+
+@dataclass
+class Request:
+    # One API call as it travels down the middleware chain. `key` names the
+    # cache entry (None: not cached) and `ttl` how long a 200 stays fresh;
+    # refresh=True skips the cached copies and goes to the network.
+    endpoint: str
+    url: str
+    params: Dict[str, Any]
+    key: Optional[Hashable] = None
+    ttl: float = 0.0
+    refresh: bool = False
+
+
+class Response:
+    # Raw response body plus where it came from ("network", "disk",
+    # "replay"). decode() parses the body once and keeps the result, so a
+    # response served from the memory cache is not parsed again.
+
+    __slots__ = ("status", "content", "headers", "source", "fetched_at", "_data")
+
+    def __init__(
+        self,
+        status: int,
+        content: bytes,
+        headers: Optional[Mapping[str, str]] = None,
+        source: str = "network",
+        fetched_at: Optional[float] = None,
+    ):
+        self.status = status
+        self.content = content
+        self.headers = headers if headers is not None else {}
+        self.source = source
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+        self._data = _UNSET
+
+    def decode(self, parse: Callable[[bytes], Any]) -> Any:
+        if self._data is _UNSET:
+            self._data = parse(self.content)
+        return self._data
+
+    @property
+    def decoded(self) -> bool:
+        return self._data is not _UNSET
+
+    @property
+    def data(self) -> Any:
+        # the decoded body, or None if decode() has not run yet
+        return None if self._data is _UNSET else self._data
+
+    @property
+    def retry_after(self) -> Optional[float]:
+        # seconds from a Retry-After header (delta or HTTP date), if any
+        value = self.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+class TransportError(Exception):
+    # The request never got an HTTP answer. `kind` is "timeout", "connect",
+    # "replay" or "other"; the service turns it into a user-facing message.
+
+    def __init__(self, message: str, kind: str = "other"):
+        super().__init__(message)
+        self.kind = kind
+
+
+class Transport:
+    # Where requests finally go. Subclasses implement send(); everything
+    # above them (caching, retries, limits) is middleware.
+
+    async def send(self, request: Request) -> Response:
+        raise NotImplementedError
+
+    async def aclose(self):
+        pass
+
+    def stats(self) -> Dict:
+        return {}
+
+
+def _http2_available() -> bool:
+    # httpx only speaks HTTP/2 when the optional "h2" package is installed
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class HttpxTransport(Transport):
+    # One keep-alive client for the lifetime of the transport, so repeated
+    # searches reuse pooled connections instead of a new TCP+TLS handshake.
+
+    def __init__(
+        self,
+        timeout: float = 10,
+        http2: bool = True,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry: float = 30.0,
+        mounts: Optional[Dict[str, httpx.AsyncBaseTransport]] = None,
+        telemetry: Optional[Telemetry] = None,
+    ):
+        self.timeout = timeout
+        self.telemetry = telemetry
+        self.http2 = http2 and _http2_available()
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.mounts = mounts
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def from_config(cls, config=CoreConfig, telemetry: Optional[Telemetry] = None, **kwargs) -> "HttpxTransport":
+        return cls(
+            timeout=config.TIMEOUT,
+            http2=config.HTTP2,
+            max_connections=config.MAX_CONNECTIONS,
+            max_keepalive_connections=config.MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=config.KEEPALIVE_EXPIRY,
+            telemetry=telemetry,
+            **kwargs,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout, http2=self.http2, limits=self.limits, mounts=self.mounts
+            )
+        return self._client
+
+    def _tracer(self):
+        # per-request httpcore trace hook: connect / TLS / wait / body timings
+        telemetry = self.telemetry
+        started: Dict[str, float] = {}
+
+        async def trace(event: str, info: Dict):
+            stage, _, phase = event.rpartition(".")
+            stage = stage.split(".", 1)[-1]
+            if phase == "started":
+                started[stage] = time.perf_counter()
+            elif stage in started:
+                name = TRACE_STAGES.get(stage)
+                seconds = time.perf_counter() - started.pop(stage)
+                if name is not None:
+                    telemetry.record(name, seconds)
+                if stage == "connect_tcp":
+                    telemetry.incr("http.connections")
+
+        return trace
+
+    async def send(self, request: Request) -> Response:
+        extensions = {"trace": self._tracer()} if self.telemetry is not None else None
+        try:
+            response = await self.client.get(request.url, params=request.params, extensions=extensions)
+        except httpx.TimeoutException as e:
+            raise TransportError(str(e) or "timed out", "timeout") from e
+        except httpx.ConnectError as e:
+            raise TransportError(str(e) or "connection failed", "connect") from e
+        except httpx.TransportError as e:
+            raise TransportError(str(e) or type(e).__name__) from e
+        return Response(response.status_code, response.content, response.headers)
+
+    async def aclose(self):
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+
+class MockTransport(HttpxTransport):
+    # The pooled httpx client with mock:// URLs served in-process by a
+    # MockBackend; any other URL still goes out over the network.
+
+    def __init__(self, backend, **kwargs):
+        super().__init__(mounts={"mock://": backend.transport()}, **kwargs)
+        self.backend = backend
+
+    def stats(self) -> Dict:
+        return {"mock": self.backend.stats()}
+
+
+class ReplayMiss(TransportError):
+
+    def __init__(self, message: str):
+        super().__init__(message, "replay")
+
+
+class ReplayTransport(Transport):
+    # Recorded responses, one file per request under `directory`, named after
+    # the endpoint and a hash of its parameters (the API key left out, so
+    # recordings can be shared, and the host too, so they replay against any
+    # base URL). With an `upstream` transport,
+    # misses are fetched from it and successful answers saved ("record"
+    # mode); without one a miss raises ReplayMiss ("replay" mode).
+
+    def __init__(self, directory, upstream: Optional[Transport] = None):
+        self.directory = Path(directory)
+        self.upstream = upstream
+        self.hits = 0
+        self.misses = 0
+        self.recorded = 0
+
+    def path_for(self, request: Request) -> Path:
+        params = {k: str(v) for k, v in request.params.items() if k != "appid"}
+        ident = json.dumps(sorted(params.items()))
+        digest = hashlib.sha256(ident.encode()).hexdigest()[:16]
+        return self.directory / f"{request.endpoint}-{digest}.json"
+
+    async def send(self, request: Request) -> Response:
+        path = self.path_for(request)
+        try:
+            content = await asyncio.to_thread(path.read_bytes)
+        except FileNotFoundError:
+            pass
+        else:
+            self.hits += 1
+            return Response(200, content, source="replay")
+
+        self.misses += 1
+        if self.upstream is None:
+            what = request.params.get("q") or request.endpoint
+            raise ReplayMiss(f"No recorded response for '{what}' (replay mode).")
+        response = await self.upstream.send(request)
+        if response.status == 200:
+            await asyncio.to_thread(self._save, path, response.content)
+            self.recorded += 1
+        return response
+
+    def _save(self, path: Path, content: bytes):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, content)
+
+    async def aclose(self):
+        if self.upstream is not None:
+            await self.upstream.aclose()
+
+    def stats(self) -> Dict:
+        stats = {"replay": {"hits": self.hits, "misses": self.misses, "recorded": self.recorded}}
+        if self.upstream is not None:
+            stats.update(self.upstream.stats())
+        return stats
+
+
+def transport_from_config(config=CoreConfig, telemetry: Optional[Telemetry] = None) -> Transport:
+    # mock:// endpoints get the in-process backend; TRANSPORT picks between
+    # live HTTP, recording and replaying
+    mode = config.TRANSPORT
+    if mode not in ("http", "record", "replay"):
+        raise ValueError(f"unknown transport {mode!r}; expected http, record or replay")
+    if mode == "replay":
+        return ReplayTransport(config.REPLAY_DIR)
+
+    urls = (config.BASE_URL, config.FORECAST_URL, config.GEOCODE_URL, config.ONECALL_URL)
+    if any(url.startswith("mock://") for url in urls):
+        from .mock_backend import MockBackend
+
+        transport: Transport = MockTransport.from_config(
+            config, telemetry, backend=MockBackend.from_config(config)
+        )
+    else:
+        transport = HttpxTransport.from_config(config, telemetry)
+    if mode == "record":
+        return ReplayTransport(config.REPLAY_DIR, upstream=transport)
+    return transport
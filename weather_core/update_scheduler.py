@@ -0,0 +1,46 @@
+import threading
+from typing import TYPE_CHECKING
+
+from .telemetry import telemetry
+
+if TYPE_CHECKING:  # the core itself does not depend on Flet
+    import flet as ft
+
+
+class UpdateScheduler:
+    # Coalesces page.update() calls. Callers mark the page dirty after
+    # changing controls; the first mark in a frame arms a timer on the page's
+    # event loop and everything changed before it fires goes out as a single
+    # diff. Safe to call from Flet's handler threads as well as the loop.
+    # Shared by both GUIs.
+
+    def __init__(self, page: "ft.Page", interval: float = 1 / 60):
+        self.page = page
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._pending = False
+        self.requests = 0
+        self.flushes = 0
+
+    def mark_dirty(self):
+        with self._lock:
+            self.requests += 1
+            if self._pending:
+                return
+            self._pending = True
+        self.page.loop.call_soon_threadsafe(self._arm)
+
+    def _arm(self):
+        self.page.loop.call_later(self.interval, self.flush)
+
+    def flush(self):
+        with self._lock:
+            if not self._pending:
+                return
+            self._pending = False
+            self.flushes += 1
+        with telemetry.span("page.update"):  # diffing and serializing the control tree
+            self.page.update()
+
+    def stats(self):
+        return {"requests": self.requests, "flushes": self.flushes}
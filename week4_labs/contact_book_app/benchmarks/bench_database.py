@@ -0,0 +1,111 @@
+"""Add/update/delete throughput of the contact database: the old default
+connection (rollback journal, full sync, a new cursor per call) vs the
+tuned one in src/database.py (WAL, synchronous=NORMAL, one reused cursor).
+Every operation is still committed on its own, as the app does.
+
+    python benchmarks/bench_database.py --contacts 100000
+
+The "before" run fsyncs on every commit, so on a slow disk it can take a
+few minutes for 100k contacts; lower --contacts to try it quickly.
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+import database  # noqa: E402
+
+
+class Before:
+    # the old database.py: default connection, commit after every statement
+
+    @staticmethod
+    def init_db(path):
+        conn = sqlite3.connect(path, check_same_thread=False)
+        cursor = conn.cursor()
+        cursor.execute(
+            "CREATE TABLE IF NOT EXISTS contacts ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT NOT NULL, phone TEXT, email TEXT)"
+        )
+        conn.commit()
+        return conn
+
+    @staticmethod
+    def add_contact_db(conn, name, phone, email):
+        cursor = conn.cursor()
+        cursor.execute("INSERT INTO contacts (name, phone, email) VALUES (?, ?, ?)", (name, phone, email))
+        conn.commit()
+
+    @staticmethod
+    def update_contact_db(conn, contact_id, name, phone, email):
+        cursor = conn.cursor()
+        cursor.execute(
+            "UPDATE contacts SET name = ?, phone = ?, email = ? WHERE id = ?",
+            (name, phone, email, contact_id),
+        )
+        conn.commit()
+
+    @staticmethod
+    def delete_contact_db(conn, contact_id):
+        cursor = conn.cursor()
+        cursor.execute("DELETE FROM contacts WHERE id = ?", (contact_id,))
+        conn.commit()
+
+    @staticmethod
+    def close_db(conn):
+        conn.close()
+
+
+def run(db, path, contacts):
+    conn = db.init_db(path)
+    timings = {}
+
+    start = time.perf_counter()
+    for i in range(contacts):
+        db.add_contact_db(conn, f"Contact {i}", f"0917{i:07d}", f"contact{i}@example.com")
+    timings["add"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(1, contacts + 1):
+        db.update_contact_db(conn, i, f"Contact {i}", f"0918{i:07d}", f"c{i}@example.com")
+    timings["update"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(1, contacts + 1):
+        db.delete_contact_db(conn, i)
+    timings["delete"] = time.perf_counter() - start
+
+    db.close_db(conn)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--contacts", type=int, default=100_000)
+    parser.add_argument("--dir", help="where to create the databases (default: a temp dir)")
+    args = parser.parse_args()
+
+    directory = args.dir or tempfile.mkdtemp()
+    os.makedirs(directory, exist_ok=True)
+    results = {}
+    for label, db in (("before", Before), ("after", database)):
+        path = os.path.join(directory, f"bench_{label}.db")
+        for suffix in ("", "-wal", "-shm", "-journal"):
+            if os.path.exists(path + suffix):
+                os.remove(path + suffix)
+        results[label] = run(db, path, args.contacts)
+
+    print(f"{args.contacts} contacts, one commit per operation ({directory})")
+    for op in ("add", "update", "delete"):
+        before, after = results["before"][op], results["after"][op]
+        print(f"{op:>7}: {args.contacts / before:9.0f} ops/s before  "
+              f"{args.contacts / after:9.0f} ops/s after  ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,57 @@
 import sqlite3
+import threading
 
-def init_db():
+DB_PATH = 'contacts.db'
+
+# Connection settings, applied once when the database is opened:
+# - WAL lets a commit append to contacts.db-wal instead of rewriting a
+#   rollback journal, and with synchronous=NORMAL it is only fsynced at
+#   checkpoints, so committing every change stays cheap. A power cut can
+#   lose the last few commits but never corrupts the file.
+# - cache_size (negative = KiB) and mmap_size keep the whole table in
+#   memory for reads once it has been loaded.
+PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -16000",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+class ContactConnection(sqlite3.Connection):
+    """Connection that runs every query through one reused cursor.
+
+    sqlite3 also keeps the prepared statements of this connection, so the
+    same SQL is compiled only once. The lock is there because Flet calls
+    the event handlers from worker threads.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.RLock()
+        self._cursor = super().cursor()
+
+    def run(self, sql, params=()):
+        """Executes one statement and commits it."""
+        with self.lock:
+            self._cursor.execute(sql, params)
+            self.commit()
+
+    def rows(self, sql, params=()):
+        """Executes a query and returns all of its rows."""
+        with self.lock:
+            return self._cursor.execute(sql, params).fetchall()
+
+
+def init_db(path=DB_PATH):
     """Initializes the database and creates the contacts table if it doesn't exist."""
-    conn = sqlite3.connect('contacts.db', check_same_thread=False)
-    cursor = conn.cursor()
-    cursor.execute('''
+    conn = sqlite3.connect(
+        path, check_same_thread=False, factory=ContactConnection, cached_statements=64
+    )
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    conn.execute('''
     CREATE TABLE IF NOT EXISTS contacts (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     name TEXT NOT NULL,
@@ -17,36 +64,33 @@ def init_db():
 
 def add_contact_db(conn, name, phone, email):
     """Adds a new contact to the database."""
-    cursor = conn.cursor()
-    cursor.execute(
+    conn.run(
         "INSERT INTO contacts (name, phone, email) VALUES (?, ?, ?)",
         (name, phone, email)
     )
-    conn.commit()
 
 def get_all_contacts_db(conn, search_term=""):
     """Retrieves all contacts from the database."""
-    cursor = conn.cursor()
     if search_term:
-        cursor.execute(
+        return conn.rows(
             "SELECT id, name, phone, email FROM contacts WHERE name LIKE ?",
             (f"%{search_term}%",)
         )
-    else:
-        cursor.execute("SELECT id, name, phone, email FROM contacts")
-    return cursor.fetchall()
+    return conn.rows("SELECT id, name, phone, email FROM contacts")
 
 def update_contact_db(conn, contact_id, name, phone, email):
     """Updates an existing contact in the database."""
-    cursor = conn.cursor()
-    cursor.execute(
+    conn.run(
         "UPDATE contacts SET name = ?, phone = ?, email = ? WHERE id = ?",
         (name, phone, email, contact_id)
     )
-    conn.commit()
 
 def delete_contact_db(conn, contact_id):
     """Deletes a contact from the database."""
-    cursor = conn.cursor()
-    cursor.execute("DELETE FROM contacts WHERE id = ?", (contact_id,))
-    conn.commit()
\ No newline at end of file
+    conn.run("DELETE FROM contacts WHERE id = ?", (contact_id,))
+
+def close_db(conn):
+    """Merges the write-ahead log back into contacts.db and closes it."""
+    with conn.lock:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        conn.close()
@@ -1,5 +1,5 @@
 import flet as ft
-from database import init_db
+from database import init_db, close_db
 from app_logic import display_contacts, add_contact
 
 def main(page: ft.Page):
@@ -10,6 +10,8 @@ def main(page: ft.Page):
     page.theme_mode = ft.ThemeMode.LIGHT
 
     db_conn = init_db()
+    # on_close fires when the session expires; a disconnect can still be resumed
+    page.on_close = lambda e: close_db(db_conn)
 
     name_input = ft.TextField(label="Name", width=350)
     phone_input = ft.TextField(label="Phone", width=350)